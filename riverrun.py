@@ -3,25 +3,67 @@ import os
 import sqlite3
 import json
 import shutil
-import webbrowser
+import subprocess
+import functools
 import platform
-from datetime import datetime
+import queue
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from string import Template
+from typing import List, Dict, Iterable, Iterator, Optional, Set, Tuple
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTabWidget, QTableWidget, QTableWidgetItem, QFormLayout, QLineEdit, 
+    QTabWidget, QTableView, QFormLayout, QLineEdit, 
     QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QPushButton, QLabel,
     QFileDialog, QMessageBox, QDialog, QDialogButtonBox, QGroupBox,
-    QListWidget, QListWidgetItem, QSplitter, QScrollArea, QFrame,
-    QGridLayout, QDateEdit, QCheckBox, QProgressBar, QMenuBar, QMenu,
-    QStatusBar, QToolBar, QHeaderView, QTreeWidget, QTreeWidgetItem,
-    QInputDialog
+    QListWidget, QListWidgetItem, QSplitter, QGridLayout, QDateEdit,
+    QStatusBar, QHeaderView, QInputDialog, QStyle, QCompleter
 )
-from PyQt6.QtCore import Qt, QDate, QTimer, pyqtSignal, QThread, QSize, QSettings
-from PyQt6.QtGui import QPixmap, QIcon, QAction, QFont, QPalette, QColor
+from PyQt6.QtCore import (
+    Qt, QDate, QTimer, pyqtSignal, QSettings,
+    QObject, QRunnable, QThreadPool, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel, QStringListModel
+)
+from PyQt6.QtGui import QIcon, QAction, QColor
+
+# Optional streaming JSON parser; imports fall back to json.load without it
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional fast JSON encoder/decoder; the json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Errors raised when an import file is not valid JSON (orjson's subclass json's)
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+# Import files at least this large are streamed rather than decoded in one go
+_STREAM_IMPORT_SIZE = 8 * 1024 * 1024
+
+# Host OS name, looked up once
+_SYSTEM = platform.system()
 
+# Command that opens a file with its default application (Windows uses os.startfile)
+_OPEN_COMMAND = 'open' if _SYSTEM == 'Darwin' else 'xdg-open'
+
+def _open_native(path):
+    """Open a file with the OS default application"""
+    if _SYSTEM == 'Windows':
+        os.startfile(path)
+    else:
+        subprocess.Popen((_OPEN_COMMAND, path))
+
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -32,6 +74,7 @@ def get_resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+@functools.lru_cache(maxsize=1)
 def get_icon_path():
     """Get the path to the icon file, works for both development and PyInstaller"""
     # Try different possible locations for the icon
@@ -47,11 +90,24 @@ def get_icon_path():
             return path
     return None
 
+# Decoded once on first use; QIcon needs a QApplication, so it can't be built at import
+_APP_ICON: Optional[QIcon] = None
+
+def get_app_icon() -> Optional[QIcon]:
+    """Get the shared application icon, or None if the icon file can't be found"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon_path = get_icon_path()
+        if icon_path:
+            _APP_ICON = QIcon(icon_path)
+    return _APP_ICON
+
+@functools.lru_cache(maxsize=1)
 def get_app_data_dir():
     """Get the OS-specific application data directory"""
     app_name = "RiverRunner"
     
-    system = platform.system()
+    system = _SYSTEM
     
     if system == "Windows":
         # Windows: %APPDATA%\RiverRunner
@@ -73,6 +129,19 @@ def get_app_data_dir():
     
     return app_dir
 
+@functools.lru_cache(maxsize=1)
+def get_attachments_dir():
+    """Get the attachments directory inside the app data directory, creating it once"""
+    attachments_dir = os.path.join(get_app_data_dir(), "attachments")
+    os.makedirs(attachments_dir, exist_ok=True)
+    return attachments_dir
+
+# Seconds database migration waits on a locked source before giving up
+_MIGRATE_BUSY_TIMEOUT = 5.0
+
+# SQLITE_BUSY and SQLITE_LOCKED result codes (sqlite3 only names them from Python 3.11)
+_SQLITE_BUSY_CODES = (5, 6)
+
 def migrate_old_data():
     """Migrate data from current directory to app data directory if needed"""
     app_dir = get_app_data_dir()
@@ -88,17 +157,39 @@ def migrate_old_data():
     
     # Migrate database file
     if os.path.exists(old_db_path) and not os.path.exists(new_db_path):
+        # Back up into a temporary file first, so a failed copy never leaves an
+        # empty database at the new path and migration is retried next start
+        temp_db_path = new_db_path + ".migrating"
+        deadline = time.monotonic() + _MIGRATE_BUSY_TIMEOUT
+        
+        def check_busy(status, remaining, total):
+            # backup() retries a locked source forever; give up once the deadline passes
+            if status in _SQLITE_BUSY_CODES and time.monotonic() > deadline:
+                raise sqlite3.OperationalError("source database is locked")
+        
         try:
-            shutil.copy2(old_db_path, new_db_path)
+            # Use the backup API so a WAL-mode source is copied as a consistent snapshot
+            src = sqlite3.connect(old_db_path, timeout=_MIGRATE_BUSY_TIMEOUT)
+            try:
+                dst = sqlite3.connect(temp_db_path)
+                try:
+                    src.backup(dst, progress=check_busy)
+                finally:
+                    dst.close()
+            finally:
+                src.close()
+            os.replace(temp_db_path, new_db_path)
             print(f"Migrated database from {old_db_path} to {new_db_path}")
             migrated = True
         except Exception as e:
+            if os.path.exists(temp_db_path):
+                os.remove(temp_db_path)
             print(f"Failed to migrate database: {e}")
     
     # Migrate attachments directory
     if os.path.exists(old_attachments_dir) and not os.path.exists(new_attachments_dir):
         try:
-            shutil.copytree(old_attachments_dir, new_attachments_dir)
+            shutil.copytree(old_attachments_dir, new_attachments_dir, copy_function=shutil.copyfile)
             print(f"Migrated attachments from {old_attachments_dir} to {new_attachments_dir}")
             migrated = True
         except Exception as e:
@@ -106,18 +197,195 @@ def migrate_old_data():
     
     return migrated
 
+# Colors for each difficulty class, built once at import
+_DIFF_COLOR_NAMES = {
+    'Class I': 'green',
+    'Class II': 'green',
+    'Class III': 'orange',
+    'Class IV': 'red',
+    'Class V': 'red',
+    'Class VI': '#C71585',  # Pinkish purple
+}
+_DIFF_COLORS = {difficulty: QColor(name) for difficulty, name in _DIFF_COLOR_NAMES.items()}
+
+# Color-coded difficulty markup for the river details pane
+_DIFFICULTY_HTML = {
+    difficulty: f'<span style="color: {name}; font-weight: bold;">{difficulty}</span>'
+    for difficulty, name in _DIFF_COLOR_NAMES.items()
+}
+
 def get_difficulty_color(difficulty):
-    """Get the color for a difficulty class"""
-    if difficulty in ['Class I', 'Class II']:
-        return QColor('green')
-    elif difficulty == 'Class III':
-        return QColor('orange')
-    elif difficulty in ['Class IV', 'Class V']:
-        return QColor('red')
-    elif difficulty == 'Class VI':
-        return QColor('#C71585')  # Pinkish purple
-    else:
-        return None  # Use default color
+    """Get the color for a difficulty class, or None to use the default color"""
+    return _DIFF_COLORS.get(difficulty)
+
+# Section heading used in the river details pane
+_DETAILS_HEADING = '<h3 style="color: #4682b4;">{}</h3>'
+
+def _has_data(value):
+    """Check if a river field has meaningful data to show"""
+    if value is None:
+        return False
+    if isinstance(value, (int, float)):
+        return True  # All numeric values are valid (including 0)
+    return value and str(value).strip() and str(value).strip().lower() != 'n/a'
+
+# Rating combo entries; the index of each entry equals its rating
+_RATING_OPTIONS = ["", "1 - Poor", "2 - Fair", "3 - Good", "4 - Very Good", "5 - Excellent"]
+
+# Difficulty classes in ascending order, and the combo entries built from them
+_DIFFICULTY_CLASSES = ["Class I", "Class II", "Class III", "Class IV", "Class V", "Class VI"]
+_DIFFICULTY_OPTIONS = [""] + _DIFFICULTY_CLASSES
+_DIFFICULTY_FILTER_OPTIONS = ["All"] + _DIFFICULTY_CLASSES
+
+# Sort keys so difficulty columns order by class number rather than text
+_DIFFICULTY_SORT_KEYS = {name: i for i, name in enumerate(_DIFFICULTY_CLASSES, 1)}
+
+# Connection-level tuning applied once when each connection is opened
+_CONNECTION_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+"""
+
+# Journal, integrity and planner settings applied to the writer connection only
+_WRITER_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA foreign_keys=ON;
+    PRAGMA analysis_limit=400;
+"""
+
+# Number of read-only connections kept alongside the writer
+_READER_POOL_SIZE = 4
+
+# Prepared statements cached per connection (sqlite3 defaults to 128)
+_STATEMENT_CACHE_SIZE = 256
+
+# SQL for the hot write paths, defined once so sqlite3's statement cache always hits
+_SQL_INSERT_RIVER = '''
+    INSERT INTO rivers (
+        name, location, region, latitude, longitude, difficulty_class,
+        length_miles, typical_flow_min, typical_flow_max, water_depth_min, water_depth_max,
+        put_in_location, take_out_location, shuttle_info, parking_details, best_seasons,
+        water_level_source, hazards, portages, emergency_contacts,
+        description, personal_rating, notes, tags
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_UPDATE_RIVER = '''
+    UPDATE rivers SET
+        name=?, location=?, region=?, latitude=?, longitude=?, difficulty_class=?,
+        length_miles=?, typical_flow_min=?, typical_flow_max=?, water_depth_min=?, water_depth_max=?,
+        put_in_location=?, take_out_location=?, shuttle_info=?, parking_details=?, best_seasons=?,
+        water_level_source=?, hazards=?, portages=?, emergency_contacts=?,
+        description=?, personal_rating=?, notes=?, tags=?, last_updated=CURRENT_TIMESTAMP
+    WHERE id=?
+'''
+
+_SQL_INSERT_DOCUMENT = '''
+    INSERT INTO river_documents (river_id, file_name, file_path, file_type, file_size, description)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_TRIP = '''
+    INSERT INTO trip_logs (
+        river_id, trip_date, companions, water_level, weather_conditions,
+        flow_rate, duration_hours, difficulty_experienced, highlights,
+        challenges, gear_used, trip_rating, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_UPDATE_TRIP = '''
+    UPDATE trip_logs SET
+        river_id=?, trip_date=?, companions=?, water_level=?, weather_conditions=?,
+        flow_rate=?, duration_hours=?, difficulty_experienced=?, highlights=?,
+        challenges=?, gear_used=?, trip_rating=?, notes=?
+    WHERE id=?
+'''
+
+# Bulk variants that take the timestamp columns as parameters, so one
+# precomputed value is reused for the batch instead of a per-row CURRENT_TIMESTAMP
+_SQL_BULK_INSERT_RIVER = '''
+    INSERT INTO rivers (
+        name, location, region, latitude, longitude, difficulty_class,
+        length_miles, typical_flow_min, typical_flow_max, water_depth_min, water_depth_max,
+        put_in_location, take_out_location, shuttle_info, parking_details, best_seasons,
+        water_level_source, hazards, portages, emergency_contacts,
+        description, personal_rating, notes, tags, date_added, last_updated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_BULK_INSERT_TRIP = '''
+    INSERT INTO trip_logs (
+        river_id, trip_date, companions, water_level, weather_conditions,
+        flow_rate, duration_hours, difficulty_experienced, highlights,
+        challenges, gear_used, trip_rating, notes, created_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Rows per executemany() call during bulk inserts
+_BULK_CHUNK_SIZE = 500
+
+# Python types sqlite3 can bind without an adapter
+_BINDABLE_TYPES = (type(None), int, float, str, bytes)
+
+def _bindable(params: Tuple) -> bool:
+    """Whether every value in a parameter tuple can be bound to a statement"""
+    return all(isinstance(value, _BINDABLE_TYPES) for value in params)
+
+def _river_params(river_data: Dict) -> Tuple:
+    """Build the column-ordered parameter tuple shared by the river INSERT and UPDATE"""
+    return (
+        river_data.get('name', ''),
+        river_data.get('location', ''),
+        river_data.get('region', ''),
+        river_data.get('latitude'),
+        river_data.get('longitude'),
+        river_data.get('difficulty_class', ''),
+        river_data.get('length_miles'),
+        river_data.get('typical_flow_min'),
+        river_data.get('typical_flow_max'),
+        river_data.get('water_depth_min'),
+        river_data.get('water_depth_max'),
+        river_data.get('put_in_location', ''),
+        river_data.get('take_out_location', ''),
+        river_data.get('shuttle_info', ''),
+        river_data.get('parking_details', ''),
+        river_data.get('best_seasons', ''),
+        river_data.get('water_level_source', ''),
+        river_data.get('hazards', ''),
+        river_data.get('portages', ''),
+        river_data.get('emergency_contacts', ''),
+        river_data.get('description', ''),
+        river_data.get('personal_rating'),
+        river_data.get('notes', ''),
+        river_data.get('tags', '')
+    )
+
+def _trip_params(trip_data: Dict) -> Tuple:
+    """Build the column-ordered parameter tuple shared by the trip log INSERT and UPDATE"""
+    return (
+        trip_data.get('river_id'),
+        trip_data.get('trip_date'),
+        trip_data.get('companions', ''),
+        trip_data.get('water_level', ''),
+        trip_data.get('weather_conditions', ''),
+        trip_data.get('flow_rate'),
+        trip_data.get('duration_hours'),
+        trip_data.get('difficulty_experienced', ''),
+        trip_data.get('highlights', ''),
+        trip_data.get('challenges', ''),
+        trip_data.get('gear_used', ''),
+        trip_data.get('trip_rating'),
+        trip_data.get('notes', '')
+    )
+
+def _river_identifier(name: str, location: str) -> Tuple[str, str]:
+    """Key import uses to treat rivers as duplicates: case- and whitespace-insensitive name and location"""
+    return sys.intern(name.lower().strip()), sys.intern(location.lower().strip())
+
+def _sql_timestamp() -> str:
+    """Current UTC time in the same format SQLite uses for CURRENT_TIMESTAMP"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
 
 class DatabaseManager:
     """Handles all database operations for the River Runner application"""
@@ -129,385 +397,420 @@ class DatabaseManager:
             db_path = os.path.join(app_dir, "river_data.db")
         
         self.db_path = db_path
+        
+        # Keep a single long-lived writer connection instead of reconnecting per call.
+        # The writer runs in autocommit mode, and the lock serializes access
+        # from Qt background workers.
+        self._lock = threading.Lock()
+        self._writer = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                       cached_statements=_STATEMENT_CACHE_SIZE)
+        self._writer.row_factory = sqlite3.Row
+        self._writer.executescript(_WRITER_PRAGMAS + _CONNECTION_PRAGMAS)
+        
         self.init_database()
-    
-    def init_database(self):
-        """Initialize the database with all required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Rivers table - main table for river information
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS rivers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                location TEXT NOT NULL,
-                region TEXT,
-                latitude REAL,
-                longitude REAL,
-                difficulty_class TEXT,
-                length_miles REAL,
-                typical_flow_min INTEGER,
-                typical_flow_max INTEGER,
-                water_depth_min INTEGER,
-                water_depth_max INTEGER,
-                put_in_location TEXT,
-                take_out_location TEXT,
-                shuttle_info TEXT,
-                parking_details TEXT,
-                best_seasons TEXT,
-                water_level_source TEXT,
-                hazards TEXT,
-                portages TEXT,
-                emergency_contacts TEXT,
-                description TEXT,
-                personal_rating INTEGER,
-                date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                notes TEXT,
-                tags TEXT
-            )
-        ''')
-        
-        # Documents/Files table for attachments
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS river_documents (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                river_id INTEGER,
-                file_name TEXT NOT NULL,
-                file_path TEXT NOT NULL,
-                file_type TEXT NOT NULL,
-                file_size INTEGER,
-                description TEXT,
-                upload_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (river_id) REFERENCES rivers (id) ON DELETE CASCADE
-            )
-        ''')
-        
-        # Trip logs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trip_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                river_id INTEGER,
-                trip_date DATE NOT NULL,
-                companions TEXT,
-                water_level TEXT,
-                weather_conditions TEXT,
-                flow_rate INTEGER,
-                duration_hours REAL,
-                difficulty_experienced TEXT,
-                highlights TEXT,
-                challenges TEXT,
-                gear_used TEXT,
-                trip_rating INTEGER,
-                notes TEXT,
-                created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (river_id) REFERENCES rivers (id) ON DELETE CASCADE
-            )
-        ''')
-        
-        # Tags/Categories table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS river_tags (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                river_id INTEGER,
-                tag TEXT NOT NULL,
-                FOREIGN KEY (river_id) REFERENCES rivers (id) ON DELETE CASCADE
-            )
-        ''')
-        
-        # Handle database migration - add new columns if they don't exist
-        # Check existing columns first to avoid unnecessary operations
-        cursor.execute("PRAGMA table_info(rivers)")
-        existing_columns = {row[1] for row in cursor.fetchall()}
-        
-        # Define required columns and their SQL
-        required_columns = {
-            'tags': "ALTER TABLE rivers ADD COLUMN tags TEXT",
-            'water_depth_min': "ALTER TABLE rivers ADD COLUMN water_depth_min INTEGER",
-            'water_depth_max': "ALTER TABLE rivers ADD COLUMN water_depth_max INTEGER"
-        }
         
-        # Only add columns that don't exist
-        for column_name, sql in required_columns.items():
-            if column_name not in existing_columns:
+        # WAL allows concurrent readers next to the writer, so reads are served
+        # from a pool of read-only connections and never wait on a commit
+        self._readers = queue.Queue()
+        # as_uri() percent-encodes characters such as # ? % that would otherwise end the path
+        reader_uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        for _ in range(_READER_POOL_SIZE):
+            reader = sqlite3.connect(reader_uri, uri=True, check_same_thread=False,
+                                     cached_statements=_STATEMENT_CACHE_SIZE)
+            reader.row_factory = sqlite3.Row
+            reader.executescript(_CONNECTION_PRAGMAS)
+            self._readers.put(reader)
+    
+    @contextmanager
+    def _read(self):
+        """Borrow a read-only connection from the pool"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def close(self):
+        """Refresh planner statistics, then close all database connections"""
+        for _ in range(_READER_POOL_SIZE):
+            self._readers.get().close()
+        with self._lock:
+            # Cheap when nothing changed; analysis_limit bounds it otherwise
+            self._writer.execute("PRAGMA optimize")
+            self._writer.close()
+    
+    def _insert_many(self, sql: str, params, on_progress=None) -> int:
+        """Run an INSERT for every parameter tuple, one transaction per chunk, reporting the running count per chunk"""
+        params = iter(params)
+        inserted = 0
+        
+        while True:
+            # Build each chunk before taking the lock, so parsing a large import
+            # never holds up writes made from the GUI thread
+            chunk = list(islice(params, _BULK_CHUNK_SIZE))
+            if not chunk:
+                break
+            with self._lock:
+                cursor = self._writer.cursor()
+                cursor.execute("BEGIN")
                 try:
-                    cursor.execute(sql)
-                    conn.commit()
-                    print(f"Added {column_name} column")
-                except sqlite3.OperationalError as e:
-                    print(f"Error adding {column_name} column: {e}")
+                    cursor.executemany(sql, chunk)
+                    inserted += cursor.rowcount
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
+            if on_progress:
+                on_progress(inserted)
+        
+        return inserted
+    
+    def _insert_rows(self, sql: str, build_params, rows: Iterable[Dict], stamp: Tuple, on_progress=None) -> Tuple[int, int]:
+        """Insert records through _insert_many, skipping any holding a value the database can't store"""
+        skipped = 0
+        
+        def params():
+            nonlocal skipped
+            for row in rows:
+                row_params = build_params(row)
+                if not _bindable(row_params):
+                    skipped += 1  # Such as a list
+                    continue
+                yield row_params + stamp
         
-        conn.commit()
-        conn.close()
+        inserted = self._insert_many(sql, params(), on_progress)
+        return inserted, skipped
+    
+    def init_database(self):
+        """Initialize the database with all required tables"""
+        with self._lock:
+            cursor = self._writer.cursor()
+            cursor.execute("BEGIN")
+            try:
+                # Rivers table - main table for river information
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS rivers (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        name TEXT NOT NULL,
+                        location TEXT NOT NULL,
+                        region TEXT,
+                        latitude REAL,
+                        longitude REAL,
+                        difficulty_class TEXT,
+                        length_miles REAL,
+                        typical_flow_min INTEGER,
+                        typical_flow_max INTEGER,
+                        water_depth_min INTEGER,
+                        water_depth_max INTEGER,
+                        put_in_location TEXT,
+                        take_out_location TEXT,
+                        shuttle_info TEXT,
+                        parking_details TEXT,
+                        best_seasons TEXT,
+                        water_level_source TEXT,
+                        hazards TEXT,
+                        portages TEXT,
+                        emergency_contacts TEXT,
+                        description TEXT,
+                        personal_rating INTEGER,
+                        date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        notes TEXT,
+                        tags TEXT
+                    )
+                ''')
+                
+                # Documents/Files table for attachments
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS river_documents (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        river_id INTEGER,
+                        file_name TEXT NOT NULL,
+                        file_path TEXT NOT NULL,
+                        file_type TEXT NOT NULL,
+                        file_size INTEGER,
+                        description TEXT,
+                        upload_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (river_id) REFERENCES rivers (id) ON DELETE CASCADE
+                    )
+                ''')
+                
+                # Trip logs table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS trip_logs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        river_id INTEGER,
+                        trip_date DATE NOT NULL,
+                        companions TEXT,
+                        water_level TEXT,
+                        weather_conditions TEXT,
+                        flow_rate INTEGER,
+                        duration_hours REAL,
+                        difficulty_experienced TEXT,
+                        highlights TEXT,
+                        challenges TEXT,
+                        gear_used TEXT,
+                        trip_rating INTEGER,
+                        notes TEXT,
+                        created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (river_id) REFERENCES rivers (id) ON DELETE CASCADE
+                    )
+                ''')
+                
+                # Tags/Categories table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS river_tags (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        river_id INTEGER,
+                        tag TEXT NOT NULL,
+                        FOREIGN KEY (river_id) REFERENCES rivers (id) ON DELETE CASCADE
+                    )
+                ''')
+                
+                # Indexes for the list ordering and per-river lookups
+                # (name, location) also covers ordering by name and the import duplicate scan
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_rivers_name_location ON rivers(name, location)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_trip_logs_river_date ON trip_logs(river_id, trip_date DESC)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_trip_logs_date ON trip_logs(trip_date DESC)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_river_documents_river ON river_documents(river_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_river_tags_river ON river_tags(river_id)')
+                
+                # Handle database migration - add new columns if they don't exist
+                # Check existing columns first to avoid unnecessary operations
+                cursor.execute("PRAGMA table_info(rivers)")
+                existing_columns = {row[1] for row in cursor.fetchall()}
+                
+                # Define required columns and their SQL
+                required_columns = {
+                    'tags': "ALTER TABLE rivers ADD COLUMN tags TEXT",
+                    'water_depth_min': "ALTER TABLE rivers ADD COLUMN water_depth_min INTEGER",
+                    'water_depth_max': "ALTER TABLE rivers ADD COLUMN water_depth_max INTEGER"
+                }
+                
+                # Only add columns that don't exist
+                for column_name, sql in required_columns.items():
+                    if column_name not in existing_columns:
+                        try:
+                            cursor.execute(sql)
+                            print(f"Added {column_name} column")
+                        except sqlite3.OperationalError as e:
+                            print(f"Error adding {column_name} column: {e}")
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
     
     def add_river(self, river_data: Dict) -> int:
         """Add a new river to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO rivers (
-                name, location, region, latitude, longitude, difficulty_class,
-                length_miles, typical_flow_min, typical_flow_max, water_depth_min, water_depth_max,
-                put_in_location, take_out_location, shuttle_info, parking_details, best_seasons,
-                water_level_source, hazards, portages, emergency_contacts,
-                description, personal_rating, notes, tags
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            river_data.get('name', ''),
-            river_data.get('location', ''),
-            river_data.get('region', ''),
-            river_data.get('latitude'),
-            river_data.get('longitude'),
-            river_data.get('difficulty_class', ''),
-            river_data.get('length_miles'),
-            river_data.get('typical_flow_min'),
-            river_data.get('typical_flow_max'),
-            river_data.get('water_depth_min'),
-            river_data.get('water_depth_max'),
-            river_data.get('put_in_location', ''),
-            river_data.get('take_out_location', ''),
-            river_data.get('shuttle_info', ''),
-            river_data.get('parking_details', ''),
-            river_data.get('best_seasons', ''),
-            river_data.get('water_level_source', ''),
-            river_data.get('hazards', ''),
-            river_data.get('portages', ''),
-            river_data.get('emergency_contacts', ''),
-            river_data.get('description', ''),
-            river_data.get('personal_rating'),
-            river_data.get('notes', ''),
-            river_data.get('tags', '')
-        ))
-        
-        river_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return river_id
-    
-    def get_all_rivers(self) -> List[Dict]:
+        with self._lock:
+            cursor = self._writer.cursor()
+            cursor.execute(_SQL_INSERT_RIVER, _river_params(river_data))
+            return cursor.lastrowid
+    
+    def add_rivers_bulk(self, rows: Iterable[Dict], on_progress=None) -> Tuple[int, int]:
+        """Add many rivers in chunked transactions and return how many were inserted and skipped"""
+        stamp = (_sql_timestamp(),) * 2
+        return self._insert_rows(_SQL_BULK_INSERT_RIVER, _river_params, rows, stamp, on_progress)
+    
+    def get_all_rivers(self) -> List[sqlite3.Row]:
         """Get all rivers from the database"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM rivers ORDER BY name')
-        rivers = [dict(row) for row in cursor.fetchall()]
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM rivers ORDER BY name')
+            return cursor.fetchall()
+    
+    def iter_rivers(self) -> Iterator[sqlite3.Row]:
+        """Yield all rivers one row at a time"""
+        with self._read() as conn:
+            yield from conn.execute('SELECT * FROM rivers ORDER BY name')
+    
+    def get_river_identifiers(self) -> Set[Tuple[str, str]]:
+        """Get the (name, location) keys import uses to recognize rivers already stored"""
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute('SELECT name, location FROM rivers')
+            return {_river_identifier(name, location) for name, location in cursor}
+    
+    def get_river_ids_by_name(self) -> Dict[str, int]:
+        """Map each river's lower-cased, trimmed name to its ID"""
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute('SELECT name, id FROM rivers')
+            return {sys.intern(name.lower().strip()): river_id for name, river_id in cursor}
+    
+    def get_river_summaries(self) -> List[sqlite3.Row]:
+        """Get the columns shown in the rivers list for all rivers"""
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, name, location, difficulty_class,
+                       length_miles, personal_rating, last_updated
+                FROM rivers ORDER BY name
+            ''')
+            return cursor.fetchall()
+    
+    def get_stats(self) -> Dict:
+        """Get the counts, totals and recent trips shown on the statistics tab"""
+        with self._read() as conn:
+            cursor = conn.cursor()
+            # All the totals in one statement; trips count only when their river
+            # still exists, matching the trip list (older databases may hold orphans)
+            cursor.execute('''
+                SELECT (SELECT COUNT(*) FROM rivers),
+                       (SELECT COALESCE(AVG(NULLIF(personal_rating, 0)), 0) FROM rivers),
+                       (SELECT COUNT(*) FROM trip_logs WHERE river_id IN (SELECT id FROM rivers)),
+                       (SELECT COALESCE(SUM(duration_hours), 0) FROM trip_logs
+                        WHERE river_id IN (SELECT id FROM rivers))
+            ''')
+            total_rivers, avg_rating, total_trips, total_trip_hours = cursor.fetchone()
+            
+            cursor.execute('''
+                SELECT COALESCE(NULLIF(difficulty_class, ''), 'Unknown'), COUNT(*)
+                FROM rivers GROUP BY 1
+            ''')
+            difficulty_counts = dict(cursor.fetchall())
+            
+            cursor.execute('''
+                SELECT t.trip_date, r.name as river_name
+                FROM trip_logs t
+                JOIN rivers r ON t.river_id = r.id
+                ORDER BY t.trip_date DESC
+                LIMIT 5
+            ''')
+            recent_trips = cursor.fetchall()
         
-        conn.close()
-        return rivers
+        return {
+            'total_rivers': total_rivers,
+            'avg_rating': avg_rating,
+            'difficulty_counts': difficulty_counts,
+            'total_trips': total_trips,
+            'total_trip_hours': total_trip_hours,
+            'recent_trips': recent_trips,
+        }
     
     def get_river_by_id(self, river_id: int) -> Optional[Dict]:
         """Get a specific river by ID"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM rivers WHERE id = ?', (river_id,))
-        row = cursor.fetchone()
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM rivers WHERE id = ?', (river_id,))
+            row = cursor.fetchone()
         
-        conn.close()
         return dict(row) if row else None
     
     def update_river(self, river_id: int, river_data: Dict):
         """Update an existing river"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE rivers SET
-                name=?, location=?, region=?, latitude=?, longitude=?, difficulty_class=?,
-                length_miles=?, typical_flow_min=?, typical_flow_max=?, water_depth_min=?, water_depth_max=?,
-                put_in_location=?, take_out_location=?, shuttle_info=?, parking_details=?, best_seasons=?,
-                water_level_source=?, hazards=?, portages=?, emergency_contacts=?,
-                description=?, personal_rating=?, notes=?, tags=?, last_updated=CURRENT_TIMESTAMP
-            WHERE id=?
-        ''', (
-            river_data.get('name', ''),
-            river_data.get('location', ''),
-            river_data.get('region', ''),
-            river_data.get('latitude'),
-            river_data.get('longitude'),
-            river_data.get('difficulty_class', ''),
-            river_data.get('length_miles'),
-            river_data.get('typical_flow_min'),
-            river_data.get('typical_flow_max'),
-            river_data.get('water_depth_min'),
-            river_data.get('water_depth_max'),
-            river_data.get('put_in_location', ''),
-            river_data.get('take_out_location', ''),
-            river_data.get('shuttle_info', ''),
-            river_data.get('parking_details', ''),
-            river_data.get('best_seasons', ''),
-            river_data.get('water_level_source', ''),
-            river_data.get('hazards', ''),
-            river_data.get('portages', ''),
-            river_data.get('emergency_contacts', ''),
-            river_data.get('description', ''),
-            river_data.get('personal_rating'),
-            river_data.get('notes', ''),
-            river_data.get('tags', ''),
-            river_id
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._writer.cursor()
+            cursor.execute(_SQL_UPDATE_RIVER, _river_params(river_data) + (river_id,))
     
     def delete_river(self, river_id: int):
-        """Delete a river and all associated data"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM rivers WHERE id = ?', (river_id,))
-        
-        conn.commit()
-        conn.close()
+        """Delete a river; its documents, trip logs and tags go with it via ON DELETE CASCADE"""
+        with self._lock:
+            self._writer.execute('DELETE FROM rivers WHERE id = ?', (river_id,))
     
     def add_document(self, river_id: int, file_path: str, description: str = ""):
         """Add a document attachment to a river"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         file_name = os.path.basename(file_path)
         file_type = os.path.splitext(file_name)[1].lower()
         file_size = os.path.getsize(file_path)
         
-        cursor.execute('''
-            INSERT INTO river_documents (river_id, file_name, file_path, file_type, file_size, description)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (river_id, file_name, file_path, file_type, file_size, description))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._writer.execute(_SQL_INSERT_DOCUMENT, (river_id, file_name, file_path, file_type, file_size, description))
     
-    def get_river_documents(self, river_id: int) -> List[Dict]:
-        """Get all documents for a specific river"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM river_documents WHERE river_id = ?', (river_id,))
-        documents = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
-        return documents
+    def delete_document(self, doc_id: int):
+        """Delete a document attachment record"""
+        with self._lock:
+            self._writer.execute('DELETE FROM river_documents WHERE id = ?', (doc_id,))
+    
+    def get_river_document_list(self, river_id: int) -> List[Tuple]:
+        """Get (id, description, file_name, file_size, upload_date, file_path) tuples for the attachment list"""
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute('''
+                SELECT id, description, file_name, file_size, upload_date, file_path
+                FROM river_documents WHERE river_id = ? ORDER BY id
+            ''', (river_id,))
+            return cursor.fetchall()
     
     def add_trip_log(self, trip_data: Dict) -> int:
         """Add a new trip log"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO trip_logs (
-                river_id, trip_date, companions, water_level, weather_conditions,
-                flow_rate, duration_hours, difficulty_experienced, highlights,
-                challenges, gear_used, trip_rating, notes
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            trip_data.get('river_id'),
-            trip_data.get('trip_date'),
-            trip_data.get('companions', ''),
-            trip_data.get('water_level', ''),
-            trip_data.get('weather_conditions', ''),
-            trip_data.get('flow_rate'),
-            trip_data.get('duration_hours'),
-            trip_data.get('difficulty_experienced', ''),
-            trip_data.get('highlights', ''),
-            trip_data.get('challenges', ''),
-            trip_data.get('gear_used', ''),
-            trip_data.get('trip_rating'),
-            trip_data.get('notes', '')
-        ))
-        
-        trip_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return trip_id
+        with self._lock:
+            cursor = self._writer.cursor()
+            cursor.execute(_SQL_INSERT_TRIP, _trip_params(trip_data))
+            return cursor.lastrowid
+    
+    def add_trip_logs_bulk(self, rows: Iterable[Dict], on_progress=None) -> Tuple[int, int]:
+        """Add many trip logs in chunked transactions and return how many were inserted and skipped"""
+        stamp = (_sql_timestamp(),)
+        return self._insert_rows(_SQL_BULK_INSERT_TRIP, _trip_params, rows, stamp, on_progress)
     
     def get_trip_log_by_id(self, trip_id: int) -> Optional[Dict]:
         """Get a specific trip log by ID"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT t.*, r.name as river_name 
-            FROM trip_logs t 
-            JOIN rivers r ON t.river_id = r.id 
-            WHERE t.id = ?
-        ''', (trip_id,))
-        row = cursor.fetchone()
-        
-        conn.close()
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT t.*, r.name as river_name
+                FROM trip_logs t
+                JOIN rivers r ON t.river_id = r.id
+                WHERE t.id = ?
+            ''', (trip_id,))
+            row = cursor.fetchone()
+        
         return dict(row) if row else None
     
     def update_trip_log(self, trip_id: int, trip_data: Dict):
         """Update an existing trip log"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE trip_logs SET
-                river_id=?, trip_date=?, companions=?, water_level=?, weather_conditions=?,
-                flow_rate=?, duration_hours=?, difficulty_experienced=?, highlights=?,
-                challenges=?, gear_used=?, trip_rating=?, notes=?
-            WHERE id=?
-        ''', (
-            trip_data.get('river_id'),
-            trip_data.get('trip_date'),
-            trip_data.get('companions', ''),
-            trip_data.get('water_level', ''),
-            trip_data.get('weather_conditions', ''),
-            trip_data.get('flow_rate'),
-            trip_data.get('duration_hours'),
-            trip_data.get('difficulty_experienced', ''),
-            trip_data.get('highlights', ''),
-            trip_data.get('challenges', ''),
-            trip_data.get('gear_used', ''),
-            trip_data.get('trip_rating'),
-            trip_data.get('notes', ''),
-            trip_id
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._writer.cursor()
+            cursor.execute(_SQL_UPDATE_TRIP, _trip_params(trip_data) + (trip_id,))
     
     def delete_trip_log(self, trip_id: int):
         """Delete a trip log"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM trip_logs WHERE id = ?', (trip_id,))
-        
-        conn.commit()
-        conn.close()
-
-    def get_trip_logs(self, river_id: int = None) -> List[Dict]:
+        with self._lock:
+            self._writer.execute('DELETE FROM trip_logs WHERE id = ?', (trip_id,))
+    
+    def get_trip_logs(self, river_id: int = None) -> List[sqlite3.Row]:
         """Get trip logs, optionally filtered by river"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        if river_id:
-            cursor.execute('''
-                SELECT t.*, r.name as river_name 
-                FROM trip_logs t 
-                JOIN rivers r ON t.river_id = r.id 
-                WHERE t.river_id = ? 
-                ORDER BY t.trip_date DESC
-            ''', (river_id,))
-        else:
-            cursor.execute('''
-                SELECT t.*, r.name as river_name 
-                FROM trip_logs t 
-                JOIN rivers r ON t.river_id = r.id 
+        with self._read() as conn:
+            cursor = conn.cursor()
+            if river_id:
+                cursor.execute('''
+                    SELECT t.*, r.name as river_name
+                    FROM trip_logs t
+                    JOIN rivers r ON t.river_id = r.id
+                    WHERE t.river_id = ?
+                    ORDER BY t.trip_date DESC
+                ''', (river_id,))
+            else:
+                cursor.execute('''
+                    SELECT t.*, r.name as river_name
+                    FROM trip_logs t
+                    JOIN rivers r ON t.river_id = r.id
+                    ORDER BY t.trip_date DESC
+                ''')
+            
+            return cursor.fetchall()
+    
+    def get_trip_identifiers(self) -> Set[Tuple[int, str]]:
+        """Get the (river_id, trip_date) keys import uses to recognize trips already stored"""
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute('SELECT river_id, trip_date FROM trip_logs')
+            return set(cursor)
+    
+    def iter_trip_logs(self) -> Iterator[sqlite3.Row]:
+        """Yield all trip logs one row at a time"""
+        with self._read() as conn:
+            yield from conn.execute('''
+                SELECT t.*, r.name as river_name
+                FROM trip_logs t
+                JOIN rivers r ON t.river_id = r.id
                 ORDER BY t.trip_date DESC
             ''')
-        
-        trips = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return trips
 
 
 class RiverFormDialog(QDialog):
@@ -519,15 +822,6 @@ class RiverFormDialog(QDialog):
         self.setup_ui()
         if river_data:
             self.populate_form(river_data)
-        
-        # Set icon for dialog
-        self.set_dialog_icon()
-    
-    def set_dialog_icon(self):
-        """Set the icon for this dialog"""
-        icon_path = get_icon_path()
-        if icon_path and os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
     
     def setup_ui(self):
         self.setWindowTitle("Add River" if not self.river_data else "Edit River")
@@ -571,14 +865,14 @@ class RiverFormDialog(QDialog):
         basic_whitewater_layout = QFormLayout()
         
         self.difficulty_combo = QComboBox()
-        self.difficulty_combo.addItems(["", "Class I", "Class II", "Class III", "Class IV", "Class V", "Class VI"])
+        self.difficulty_combo.addItems(_DIFFICULTY_OPTIONS)
         self.length_edit = QDoubleSpinBox()
         self.length_edit.setRange(0, 999)
         self.length_edit.setDecimals(1)
         self.length_edit.setSuffix(" miles")
         
         self.rating_combo = QComboBox()
-        self.rating_combo.addItems(["", "1 - Poor", "2 - Fair", "3 - Good", "4 - Very Good", "5 - Excellent"])
+        self.rating_combo.addItems(_RATING_OPTIONS)
         
         basic_whitewater_layout.addRow("Difficulty Class:", self.difficulty_combo)
         basic_whitewater_layout.addRow("Length:", self.length_edit)
@@ -757,12 +1051,10 @@ class RiverFormDialog(QDialog):
         if river_data.get('water_depth_max'):
             self.depth_max_edit.setValue(river_data['water_depth_max'])
         
-        if river_data.get('personal_rating'):
-            rating_text = f"{river_data['personal_rating']} - "
-            for i in range(self.rating_combo.count()):
-                if self.rating_combo.itemText(i).startswith(rating_text):
-                    self.rating_combo.setCurrentIndex(i)
-                    break
+        rating = river_data.get('personal_rating')
+        # Imported ratings can be stored as text or floats, which leave the combo blank
+        if isinstance(rating, int) and 1 <= rating < len(_RATING_OPTIONS):
+            self.rating_combo.setCurrentIndex(rating)
         
         self.put_in_edit.setText(river_data.get('put_in_location', ''))
         self.take_out_edit.setText(river_data.get('take_out_location', ''))
@@ -784,21 +1076,21 @@ class RiverFormDialog(QDialog):
     
     def get_river_data(self) -> Dict:
         """Get the river data from the form"""
-        rating_text = self.rating_combo.currentText()
-        rating = int(rating_text[0]) if rating_text and rating_text[0].isdigit() else None
+        # Combo index is the rating itself; index 0 is the blank entry
+        rating = self.rating_combo.currentIndex() or None
         
         return {
             'name': self.name_edit.text().strip(),
             'location': self.location_edit.text().strip(),
             'region': self.region_edit.text().strip(),
-            'latitude': self.latitude_edit.value() if self.latitude_edit.value() != 0 else None,
-            'longitude': self.longitude_edit.value() if self.longitude_edit.value() != 0 else None,
+            'latitude': self.latitude_edit.value() or None,
+            'longitude': self.longitude_edit.value() or None,
             'difficulty_class': self.difficulty_combo.currentText(),
-            'length_miles': self.length_edit.value() if self.length_edit.value() != 0 else None,
-            'typical_flow_min': self.flow_min_edit.value() if self.flow_min_edit.value() != 0 else None,
-            'typical_flow_max': self.flow_max_edit.value() if self.flow_max_edit.value() != 0 else None,
-            'water_depth_min': self.depth_min_edit.value() if self.depth_min_edit.value() != 0 else None,
-            'water_depth_max': self.depth_max_edit.value() if self.depth_max_edit.value() != 0 else None,
+            'length_miles': self.length_edit.value() or None,
+            'typical_flow_min': self.flow_min_edit.value() or None,
+            'typical_flow_max': self.flow_max_edit.value() or None,
+            'water_depth_min': self.depth_min_edit.value() or None,
+            'water_depth_max': self.depth_max_edit.value() or None,
             'personal_rating': rating,
             'put_in_location': self.put_in_edit.text().strip(),
             'take_out_location': self.take_out_edit.text().strip(),
@@ -826,15 +1118,6 @@ class TripLogDialog(QDialog):
         self.setup_ui()
         if trip_data:
             self.populate_form(trip_data)
-        
-        # Set icon for dialog
-        self.set_dialog_icon()
-    
-    def set_dialog_icon(self):
-        """Set the icon for this dialog"""
-        icon_path = get_icon_path()
-        if icon_path and os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
     
     def setup_ui(self):
         self.setWindowTitle("Add Trip Log" if not self.trip_data else "Edit Trip Log")
@@ -848,14 +1131,14 @@ class TripLogDialog(QDialog):
         
         # River selection
         self.river_combo = QComboBox()
-        for river in self.rivers:
-            self.river_combo.addItem(river['name'], river['id'])
+        self.river_combo.addItems([river['name'] for river in self.rivers])
+        
+        # Keep ids on the Python side, in combo row order, instead of as item data
+        self._river_ids = [river['id'] for river in self.rivers]
+        self._river_index = {river_id: i for i, river_id in enumerate(self._river_ids)}
         
         if self.selected_river_id:
-            for i in range(self.river_combo.count()):
-                if self.river_combo.itemData(i) == self.selected_river_id:
-                    self.river_combo.setCurrentIndex(i)
-                    break
+            self.select_river(self.selected_river_id)
         
         # Trip details
         self.date_edit = QDateEdit()
@@ -878,7 +1161,7 @@ class TripLogDialog(QDialog):
         self.difficulty_edit = QLineEdit()
         
         self.rating_combo = QComboBox()
-        self.rating_combo.addItems(["", "1 - Poor", "2 - Fair", "3 - Good", "4 - Very Good", "5 - Excellent"])
+        self.rating_combo.addItems(_RATING_OPTIONS)
         
         # Text areas
         self.highlights_edit = QTextEdit()
@@ -918,20 +1201,22 @@ class TripLogDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
+    def select_river(self, river_id):
+        """Select the given river in the combo, if it is listed"""
+        index = self._river_index.get(river_id)
+        if index is not None:
+            self.river_combo.setCurrentIndex(index)
+    
     def populate_form(self, trip_data):
         """Populate form with existing trip data"""
         # Set the river selection
-        for i in range(self.river_combo.count()):
-            if self.river_combo.itemData(i) == trip_data.get('river_id'):
-                self.river_combo.setCurrentIndex(i)
-                break
+        self.select_river(trip_data.get('river_id'))
         
         # Set the date
         if trip_data.get('trip_date'):
-            date_parts = trip_data['trip_date'].split('-')
-            if len(date_parts) == 3:
-                year, month, day = map(int, date_parts)
-                self.date_edit.setDate(QDate(year, month, day))
+            trip_date = QDate.fromString(trip_data['trip_date'], 'yyyy-MM-dd')
+            if trip_date.isValid():
+                self.date_edit.setDate(trip_date)
         
         # Set text fields
         self.companions_edit.setText(trip_data.get('companions', ''))
@@ -947,12 +1232,9 @@ class TripLogDialog(QDialog):
         self.difficulty_edit.setText(trip_data.get('difficulty_experienced', ''))
         
         # Set rating
-        if trip_data.get('trip_rating'):
-            rating_text = f"{trip_data['trip_rating']} - "
-            for i in range(self.rating_combo.count()):
-                if self.rating_combo.itemText(i).startswith(rating_text):
-                    self.rating_combo.setCurrentIndex(i)
-                    break
+        rating = trip_data.get('trip_rating')
+        if isinstance(rating, int) and 1 <= rating < len(_RATING_OPTIONS):
+            self.rating_combo.setCurrentIndex(rating)
         
         # Set text areas
         self.highlights_edit.setPlainText(trip_data.get('highlights', ''))
@@ -962,17 +1244,18 @@ class TripLogDialog(QDialog):
     
     def get_trip_data(self) -> Dict:
         """Get the trip data from the form"""
-        rating_text = self.rating_combo.currentText()
-        rating = int(rating_text[0]) if rating_text and rating_text[0].isdigit() else None
+        # Combo index is the rating itself; index 0 is the blank entry
+        rating = self.rating_combo.currentIndex() or None
+        river_index = self.river_combo.currentIndex()
         
         return {
-            'river_id': self.river_combo.currentData(),
+            'river_id': self._river_ids[river_index] if river_index >= 0 else None,
             'trip_date': self.date_edit.date().toString('yyyy-MM-dd'),
             'companions': self.companions_edit.text().strip(),
             'water_level': self.water_level_edit.text().strip(),
             'weather_conditions': self.weather_edit.text().strip(),
-            'flow_rate': self.flow_rate_edit.value() if self.flow_rate_edit.value() != 0 else None,
-            'duration_hours': self.duration_edit.value() if self.duration_edit.value() != 0 else None,
+            'flow_rate': self.flow_rate_edit.value() or None,
+            'duration_hours': self.duration_edit.value() or None,
             'difficulty_experienced': self.difficulty_edit.text().strip(),
             'trip_rating': rating,
             'highlights': self.highlights_edit.toPlainText().strip(),
@@ -990,9 +1273,7 @@ class FileAttachmentWidget(QWidget):
         self.river_id = None
         self.db_manager = None
         # Use app data directory for attachments
-        app_dir = get_app_data_dir()
-        self.attachments_dir = os.path.join(app_dir, "attachments")
-        os.makedirs(self.attachments_dir, exist_ok=True)
+        self.attachments_dir = get_attachments_dir()
         self.setup_ui()
     
     def setup_ui(self):
@@ -1054,7 +1335,7 @@ class FileAttachmentWidget(QWidget):
                 new_file_name = f"{timestamp}_{file_name}"
                 new_file_path = os.path.join(self.attachments_dir, new_file_name)
                 
-                shutil.copy2(file_path, new_file_path)
+                shutil.copyfile(file_path, new_file_path)
                 
                 # Add to database
                 file_name = os.path.basename(file_path)
@@ -1080,20 +1361,34 @@ class FileAttachmentWidget(QWidget):
         if not self.river_id or not self.db_manager:
             return
         
-        self.file_list.clear()
-        documents = self.db_manager.get_river_documents(self.river_id)
+        documents = self.db_manager.get_river_document_list(self.river_id)
         
-        for doc in documents:
-            # Just show the description, not the timestamped filename
-            item_text = doc['description']
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, doc)
-            
-            # Add tooltip showing the actual filename and file info
-            tooltip = f"File: {doc['file_name']}\nSize: {doc['file_size']} bytes\nUploaded: {doc['upload_date'][:16]}"
-            item.setToolTip(tooltip)
-            
-            self.file_list.addItem(item)
+        add_item = self.file_list.addItem
+        user_role = Qt.ItemDataRole.UserRole
+        missing_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning)
+        
+        # Repaint once, and emit no per-item signals, while the list is rebuilt
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        try:
+            self.file_list.clear()
+            for doc_id, description, file_name, file_size, upload_date, file_path in documents:
+                # Stat each file once per refresh; open_file reuses the result
+                exists = os.path.exists(file_path)
+                
+                # Just show the description, not the timestamped filename
+                item = QListWidgetItem(description)
+                item.setData(user_role, (doc_id, description, file_path, exists))
+                if not exists:
+                    item.setIcon(missing_icon)
+                
+                # Add tooltip showing the actual filename and file info
+                item.setToolTip(f"File: {file_name}\nSize: {file_size} bytes\nUploaded: {upload_date[:16]}")
+                
+                add_item(item)
+        finally:
+            self.file_list.blockSignals(False)
+            self.file_list.setUpdatesEnabled(True)
     
     def open_selected_file(self):
         """Open the selected file"""
@@ -1103,20 +1398,11 @@ class FileAttachmentWidget(QWidget):
     
     def open_file(self, item):
         """Open a file"""
-        doc_data = item.data(Qt.ItemDataRole.UserRole)
-        file_path = doc_data['file_path']
+        _, _, file_path, exists = item.data(Qt.ItemDataRole.UserRole)
         
-        if os.path.exists(file_path):
-            import subprocess
-            import platform
-            
+        if exists:
             try:
-                if platform.system() == 'Darwin':  # macOS
-                    subprocess.call(('open', file_path))
-                elif platform.system() == 'Windows':  # Windows
-                    os.startfile(file_path)
-                else:  # Linux
-                    subprocess.call(('xdg-open', file_path))
+                _open_native(file_path)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to open file: {str(e)}")
         else:
@@ -1128,27 +1414,26 @@ class FileAttachmentWidget(QWidget):
         if not current_item:
             return
         
-        doc_data = current_item.data(Qt.ItemDataRole.UserRole)
+        doc_id, description, file_path, exists = current_item.data(Qt.ItemDataRole.UserRole)
         
         reply = QMessageBox.question(
             self,
             "Confirm Delete",
-            f"Are you sure you want to remove '{doc_data['description']}'?",
+            f"Are you sure you want to remove '{description}'?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 # Remove from database
-                conn = sqlite3.connect(self.db_manager.db_path)
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM river_documents WHERE id = ?', (doc_data['id'],))
-                conn.commit()
-                conn.close()
+                self.db_manager.delete_document(doc_id)
                 
                 # Remove physical file
-                if os.path.exists(doc_data['file_path']):
-                    os.remove(doc_data['file_path'])
+                if exists:
+                    try:
+                        os.remove(file_path)
+                    except FileNotFoundError:
+                        pass
                 
                 self.refresh_file_list()
                 QMessageBox.information(self, "Success", "File removed successfully!")
@@ -1157,20 +1442,463 @@ class FileAttachmentWidget(QWidget):
                 QMessageBox.critical(self, "Error", f"Failed to remove file: {str(e)}")
 
 
-class SortableTableWidgetItem(QTableWidgetItem):
-    """A QTableWidgetItem that properly handles numeric sorting"""
+def _format_river_row(river):
+    """Format the display text of each column of a river row"""
+    return (
+        str(river['id']),
+        river['name'],
+        river['location'],
+        river['difficulty_class'] or '',
+        f"{river['length_miles']:.1f}" if river['length_miles'] is not None else '',
+        str(river['personal_rating']) if river['personal_rating'] is not None else '',
+        river['last_updated'][:10] if river['last_updated'] else '',
+    )
+
+
+class RiverTableModel(QAbstractTableModel):
+    """Table model backing the rivers list"""
+    
+    HEADERS = ["ID", "Name", "Location", "Difficulty", "Length (mi)", "Rating", "Last Updated"]
+    COLS = ['id', 'name', 'location', 'difficulty_class', 'length_miles', 'personal_rating', 'last_updated']
+    
+    # Role the sort proxy orders by, so numeric columns sort numerically
+    SORT_ROLE = Qt.ItemDataRole.UserRole
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._cells = {}  # River id -> formatted column text
+    
+    def set_rivers(self, rivers):
+        """Load a fresh set of rivers, formatting their display text once"""
+        self._cells = {river['id']: _format_river_row(river) for river in rivers}
+        self.show_rivers(rivers)
+    
+    def show_rivers(self, rivers):
+        """Show a subset of the loaded rivers, reusing their formatted text"""
+        self.beginResetModel()
+        self._rows = rivers
+        self.endResetModel()
+    
+    def river_at(self, row):
+        """Get the river row at a model row"""
+        return self._rows[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLS)
     
-    def __init__(self, text, sort_key=None):
-        super().__init__(text)
-        self.sort_key = sort_key
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
     
-    def __lt__(self, other):
-        if self.sort_key is not None and hasattr(other, 'sort_key') and other.sort_key is not None:
-            # Both items have sort keys, compare them
-            return self.sort_key < other.sort_key
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
         
-        # Fall back to string comparison
-        return super().__lt__(other)
+        column = index.column()
+        river = self._rows[index.row()]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._cells[river['id']][column]
+        
+        value = river[self.COLS[column]]
+        
+        if role == self.SORT_ROLE:
+            if column == 3:
+                return _DIFFICULTY_SORT_KEYS.get(value, 0)
+            if column in (4, 5):
+                return value if value is not None else -1  # Empty values sort first
+            return self.data(index, Qt.ItemDataRole.DisplayRole)
+        
+        if role == Qt.ItemDataRole.ForegroundRole and column == 3:
+            return get_difficulty_color(value)
+        
+        return None
+
+
+class TripTableModel(QAbstractTableModel):
+    """Table model backing the trip logs list"""
+    
+    HEADERS = ["ID", "River", "Date", "Companions", "Duration", "Rating", "Water Level", "Weather"]
+    COLS = ['id', 'river_name', 'trip_date', 'companions', 'duration_hours', 'trip_rating', 'water_level', 'weather_conditions']
+    
+    # Role the sort proxy orders by, so numeric columns sort numerically
+    SORT_ROLE = Qt.ItemDataRole.UserRole
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def set_trips(self, trips):
+        """Replace the rows shown by the model"""
+        self.beginResetModel()
+        self._rows = trips
+        self.endResetModel()
+    
+    def trip_at(self, row):
+        """Get the trip row at a model row"""
+        return self._rows[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        value = self._rows[index.row()][self.COLS[column]]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if value is None:
+                return ''
+            if column == 4:  # Duration
+                return f"{value:.1f}h"
+            return str(value)
+        
+        if role == self.SORT_ROLE:
+            if column in (4, 5):
+                return value if value is not None else -1  # Empty values sort first
+            return self.data(index, Qt.ItemDataRole.DisplayRole)
+        
+        return None
+
+
+class DBWorkerSignals(QObject):
+    """Delivers DBWorker results to their callbacks on the GUI thread"""
+    
+    finished = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+    progress = pyqtSignal(str)  # Status text from long-running calls
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Queued across threads, so callbacks always run on the GUI thread
+        self.finished.connect(self.deliver)
+    
+    def deliver(self, callback, result):
+        callback(result)
+
+
+class DBWorker(QRunnable):
+    """Runs a database call on a thread pool and posts the result back"""
+    
+    def __init__(self, signals, fn, on_done, *args):
+        super().__init__()
+        self.signals = signals
+        self.fn = fn
+        self.on_done = on_done
+        self.args = args
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.on_done, result)
+
+
+_QSS_WHITESPACE = re.compile(r"\s+")
+_QSS_PUNCTUATION = re.compile(r"\s*([{};:,])\s*")
+
+def _minify_qss(qss: str) -> str:
+    """Collapse whitespace in a stylesheet so Qt has less text to parse"""
+    return _QSS_PUNCTUATION.sub(r"\1", _QSS_WHITESPACE.sub(" ", qss)).strip()
+
+# Shared theme stylesheet; each theme fills in its own palette
+_QSS_TEMPLATE = Template("""
+    QMainWindow {
+        background-color: $bg;
+        color: $fg;
+    }
+    QWidget {
+        background-color: $bg;
+        color: $fg;
+    }
+    QTabWidget::pane {
+        border: 1px solid $border;
+        background-color: $bg;
+    }
+    QTabBar::tab {
+        background-color: $header_bg;
+        color: $fg;
+        border: 1px solid $border;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        font-weight: $tab_font_weight;
+    }
+    QTabBar::tab:selected {
+        background-color: $accent;
+        color: #ffffff;
+        border-bottom: 1px solid $accent;
+    }
+    QTabBar::tab:hover {
+        background-color: $header_hover;
+        color: #ffffff;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid $border;
+        border-radius: 5px;
+        margin-top: 1ex;
+        padding-top: 10px;
+        background-color: $panel_bg;
+        color: $fg;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: $fg;
+    }
+    QPushButton {
+        background-color: $accent;
+        border: none;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: $accent_hover;
+    }
+    QPushButton:pressed {
+        background-color: $accent_pressed;
+    }
+    QLineEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QDateEdit {
+        background-color: $input_bg;
+        border: 1px solid $border_light;
+        border-radius: 3px;
+        padding: 5px;
+        color: $fg;
+    }
+    QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
+        border: 2px solid $accent;
+    }
+    QTableView {
+        background-color: $view_bg;
+        alternate-background-color: $alternate_bg;
+        gridline-color: $border_light;
+        color: $fg;
+        selection-background-color: $accent;
+    }
+    QTableView::item {
+        padding: 5px;
+        border-bottom: 1px solid $border_light;
+    }
+    QTableView::item:selected {
+        background-color: $accent;
+        color: #ffffff;
+    }
+    QHeaderView::section {
+        background-color: $header_bg;
+        color: $fg;
+        padding: 5px;
+        border: 1px solid $border;
+        font-weight: bold;
+    }
+    QHeaderView::section:hover {
+        background-color: $header_hover;
+        color: #ffffff;
+    }
+    QListWidget {
+        background-color: $view_bg;
+        border: 1px solid $border_light;
+        color: $fg;
+    }
+    QListWidget::item {
+        padding: 5px;
+        border-bottom: 1px solid $border_light;
+    }
+    QListWidget::item:selected {
+        background-color: $accent;
+        color: #ffffff;
+    }
+    QListWidget::item:hover {
+        background-color: $item_hover;
+        color: $fg;
+    }
+    QListWidget::item:selected:hover {
+        background-color: $selected_hover;
+        color: #ffffff;
+    }
+    QLabel {
+        color: $fg;
+    }
+    QScrollBar:vertical {
+        background-color: $scrollbar_bg;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: $border;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: $scrollbar_handle_hover;
+    }
+    QScrollBar:horizontal {
+        background-color: $scrollbar_bg;
+        height: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:horizontal {
+        background-color: $border;
+        border-radius: 6px;
+        min-width: 20px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background-color: $scrollbar_handle_hover;
+    }
+    QMenuBar {
+        background-color: $bar_bg;
+        color: $fg;
+        border-bottom: 1px solid $border;
+    }
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 5px 10px;
+    }
+    QMenuBar::item:selected {
+        background-color: $accent;
+        color: #ffffff;
+    }
+    QMenu {
+        background-color: $panel_bg;
+        color: $fg;
+        border: 1px solid $border;
+    }
+    QMenu::item {
+        padding: 5px 10px;
+    }
+    QMenu::item:selected {
+        background-color: $accent;
+        color: #ffffff;
+    }
+    QStatusBar {
+        background-color: $bar_bg;
+        color: $fg;
+        border-top: 1px solid $border;
+    }
+""")
+
+_DARK_PALETTE = {
+    'bg': '#2b2b2b',
+    'fg': '#ffffff',
+    'panel_bg': '#333333',
+    'view_bg': '#333333',
+    'input_bg': '#404040',
+    'alternate_bg': '#404040',
+    'bar_bg': '#333333',
+    'header_bg': '#404040',
+    'header_hover': '#505050',
+    'item_hover': '#505050',
+    'selected_hover': '#505050',
+    'border': '#555555',
+    'border_light': '#555555',
+    'accent': '#4CAF50',
+    'accent_hover': '#45a049',
+    'accent_pressed': '#3d8b40',
+    'scrollbar_bg': '#404040',
+    'scrollbar_handle_hover': '#666666',
+    'tab_font_weight': 'normal',
+}
+
+_NATURE_PALETTE = {
+    'bg': '#e8f4f8',
+    'fg': '#2c5530',
+    'panel_bg': '#f8fffe',
+    'view_bg': '#ffffff',
+    'input_bg': '#ffffff',
+    'alternate_bg': '#f0f8ff',
+    'bar_bg': '#a8d5ba',
+    'header_bg': '#a8d5ba',
+    'header_hover': '#7fb069',
+    'item_hover': '#f0f8ff',
+    'selected_hover': '#5a9bd4',
+    'border': '#7fb069',
+    'border_light': '#a8d5ba',
+    'accent': '#4682b4',
+    'accent_hover': '#5a9bd4',
+    'accent_pressed': '#2e6da4',
+    'scrollbar_bg': '#d4e9f1',
+    'scrollbar_handle_hover': '#88c999',
+    'tab_font_weight': 'bold',
+}
+
+# Theme stylesheets, minified once at import rather than rebuilt on every theme switch
+_DARK_QSS = _minify_qss(_QSS_TEMPLATE.substitute(_DARK_PALETTE))
+_NATURE_QSS = _minify_qss(_QSS_TEMPLATE.substitute(_NATURE_PALETTE))
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode obj as UTF-8 JSON, stringifying values JSON has no type for"""
+    if orjson:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode()
+
+def _json_loads(data: bytes):
+    """Decode a JSON document"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _write_json_rows(f, rows) -> int:
+    """Write database rows to binary file f as a JSON array, one object per line, and return the row count"""
+    count = 0
+    f.write(b'[')
+    for row in rows:
+        f.write(b',\n' if count else b'\n')
+        f.write(_json_dumps(dict(row)))
+        count += 1
+    f.write(b'\n]' if count else b']')
+    return count
+
+def _read_export(file_path):
+    """Get the rivers and trips of an export file as iterables, or None if it is not River Runner data"""
+    # Small files decode fastest in one go; large ones are streamed when ijson is installed
+    if ijson is None or os.path.getsize(file_path) < _STREAM_IMPORT_SIZE:
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
+        if not isinstance(data, dict) or 'rivers' not in data:
+            return None
+        return data.get('rivers', []), data.get('trips', [])
+    
+    if not _is_export_file(file_path):
+        return None
+    return _iter_export_items(file_path, 'rivers'), _iter_export_items(file_path, 'trips')
+
+def _is_export_file(file_path) -> bool:
+    """Check that a file holds a JSON object with a top-level rivers list"""
+    # Stops at the rivers key. Malformed JSON later in the file surfaces while the rivers stream in;
+    # chunks committed before it stay imported and are reported with the error
+    with open(file_path, 'rb') as f:
+        events = ijson.parse(f)
+        if next(events, None) != ('', 'start_map', None):
+            return False
+        for prefix, event, value in events:
+            if not prefix and event == 'map_key' and value == 'rivers':
+                return True
+    return False
+
+def _iter_export_items(file_path, key):
+    """Yield the entries of one top-level list in an export file, one at a time"""
+    with open(file_path, 'rb') as f:
+        yield from ijson.items(f, f'{key}.item', use_float=True)
 
 
 class MainWindow(QMainWindow):
@@ -1183,13 +1911,28 @@ class MainWindow(QMainWindow):
         migrated = migrate_old_data()
         
         self.db_manager = DatabaseManager()
+        
+        # Database reads run off the GUI thread; a single worker keeps
+        # results arriving in the order they were requested
+        self.db_pool = QThreadPool(self)
+        self.db_pool.setMaxThreadCount(1)
+        self.db_signals = DBWorkerSignals(self)
+        self.db_signals.failed.connect(self.show_db_error)
+        self.original_rivers_data = []
+        self.river_search_entries = []  # (search text, difficulty, river) per river
+        self.last_filter = ("", "All", [])  # (search text, difficulty, matching entries)
+        self.fitted_tables = set()
+        self.stats_dirty = False  # Data changed while the statistics tab was hidden
+        self.current_river_data = None  # River shown in the details pane
+        self.import_summary_box = None  # Message boxes built the first time they are shown
+        self.data_location_box = None
+        
         self.settings = QSettings("RiverRunner", "RiverRunner")
         self.dark_mode = self.settings.value("dark_mode", False, type=bool)
         self.include_trip_logs = self.settings.value("include_trip_logs", True, type=bool)
         self.setup_ui()
         self.apply_theme()
         self.refresh_rivers_table()
-        self.refresh_trips_table()
         
         # Set the application icon
         self.set_application_icon()
@@ -1204,11 +1947,24 @@ class MainWindow(QMainWindow):
                 "This follows operating system conventions and keeps your data safe and organized."
             )
     
+    def run_db_task(self, fn, on_done, *args):
+        """Run a database call on the worker pool and hand its result to on_done"""
+        self.db_pool.start(DBWorker(self.db_signals, fn, on_done, *args))
+    
+    def show_db_error(self, message):
+        """Report a failed background database call"""
+        QMessageBox.critical(self, "Database Error", f"Failed to load data: {message}")
+    
+    def shutdown(self):
+        """Wait for pending database work, close the database and flush settings"""
+        self.db_pool.waitForDone()
+        self.db_manager.close()
+        self.settings.sync()
+    
     def set_application_icon(self):
         """Set the application icon for the main window and application"""
-        icon_path = get_icon_path()
-        if icon_path and os.path.exists(icon_path):
-            icon = QIcon(icon_path)
+        icon = get_app_icon()
+        if icon:
             self.setWindowIcon(icon)
             # Also set it as the application icon for taskbar
             QApplication.instance().setWindowIcon(icon)
@@ -1226,10 +1982,18 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.addWidget(self.tab_widget)
         
-        # Create tabs
+        # Create tabs; Trip Logs and Statistics start as empty pages and are
+        # built (and loaded) the first time they are shown
         self.create_rivers_tab()
-        self.create_trip_logs_tab()
-        self.create_stats_tab()
+        self.trips_page = QWidget()
+        self.tab_widget.addTab(self.trips_page, "Trip Logs")
+        self.stats_page = QWidget()
+        self.tab_widget.addTab(self.stats_page, "Statistics")
+        self.pending_tabs = {
+            self.trips_page: self.create_trip_logs_tab,
+            self.stats_page: self.create_stats_tab,
+        }
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         # Create menu bar
         self.create_menu_bar()
@@ -1238,6 +2002,7 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
+        self.db_signals.progress.connect(self.status_bar.showMessage)
     
     def apply_theme(self):
         """Apply the current theme"""
@@ -1248,356 +2013,11 @@ class MainWindow(QMainWindow):
     
     def apply_dark_theme(self):
         """Apply the dark theme"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                background-color: #2b2b2b;
-            }
-            QTabBar::tab {
-                background-color: #404040;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4CAF50;
-                color: #ffffff;
-                border-bottom: 1px solid #4CAF50;
-            }
-            QTabBar::tab:hover {
-                background-color: #505050;
-                color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-                background-color: #333333;
-                color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QLineEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QDateEdit {
-                background-color: #404040;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                padding: 5px;
-                color: #ffffff;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border: 2px solid #4CAF50;
-            }
-            QTableWidget {
-                background-color: #333333;
-                alternate-background-color: #404040;
-                gridline-color: #555555;
-                color: #ffffff;
-                selection-background-color: #4CAF50;
-            }
-            QTableWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #555555;
-            }
-            QTableWidget::item:selected {
-                background-color: #4CAF50;
-                color: #ffffff;
-            }
-            QHeaderView::section {
-                background-color: #404040;
-                color: #ffffff;
-                padding: 5px;
-                border: 1px solid #555555;
-                font-weight: bold;
-            }
-            QHeaderView::section:hover {
-                background-color: #505050;
-            }
-            QListWidget {
-                background-color: #333333;
-                border: 1px solid #555555;
-                color: #ffffff;
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #555555;
-            }
-            QListWidget::item:selected {
-                background-color: #4CAF50;
-                color: #ffffff;
-            }
-            QListWidget::item:hover {
-                background-color: #505050;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #555555;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #666666;
-            }
-            QScrollBar:horizontal {
-                background-color: #404040;
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #555555;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #666666;
-            }
-            QMenuBar {
-                background-color: #333333;
-                color: #ffffff;
-                border-bottom: 1px solid #555555;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 5px 10px;
-            }
-            QMenuBar::item:selected {
-                background-color: #4CAF50;
-            }
-            QMenu {
-                background-color: #333333;
-                color: #ffffff;
-                border: 1px solid #555555;
-            }
-            QMenu::item {
-                padding: 5px 10px;
-            }
-            QMenu::item:selected {
-                background-color: #4CAF50;
-            }
-            QStatusBar {
-                background-color: #333333;
-                color: #ffffff;
-                border-top: 1px solid #555555;
-            }
-        """)
+        self.setStyleSheet(_DARK_QSS)
     
     def apply_nature_theme(self):
         """Apply the nature-inspired theme"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #e8f4f8;
-                color: #2c5530;
-            }
-            QWidget {
-                background-color: #e8f4f8;
-                color: #2c5530;
-            }
-            QTabWidget::pane {
-                border: 1px solid #7fb069;
-                background-color: #e8f4f8;
-            }
-            QTabBar::tab {
-                background-color: #a8d5ba;
-                color: #2c5530;
-                border: 1px solid #7fb069;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: #4682b4;
-                color: #ffffff;
-                border-bottom: 1px solid #4682b4;
-            }
-            QTabBar::tab:hover {
-                background-color: #7fb069;
-                color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #7fb069;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-                background-color: #f8fffe;
-                color: #2c5530;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c5530;
-            }
-            QPushButton {
-                background-color: #4682b4;
-                border: none;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a9bd4;
-            }
-            QPushButton:pressed {
-                background-color: #2e6da4;
-            }
-            QLineEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QDateEdit {
-                background-color: #ffffff;
-                border: 1px solid #a8d5ba;
-                border-radius: 3px;
-                padding: 5px;
-                color: #2c5530;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border: 2px solid #4682b4;
-            }
-            QTableWidget {
-                background-color: #ffffff;
-                alternate-background-color: #f0f8ff;
-                gridline-color: #a8d5ba;
-                color: #2c5530;
-                selection-background-color: #4682b4;
-            }
-            QTableWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #a8d5ba;
-            }
-            QTableWidget::item:selected {
-                background-color: #4682b4;
-                color: #ffffff;
-            }
-            QHeaderView::section {
-                background-color: #a8d5ba;
-                color: #2c5530;
-                padding: 5px;
-                border: 1px solid #7fb069;
-                font-weight: bold;
-            }
-            QHeaderView::section:hover {
-                background-color: #7fb069;
-                color: #ffffff;
-            }
-            QListWidget {
-                background-color: #ffffff;
-                border: 1px solid #a8d5ba;
-                color: #2c5530;
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #a8d5ba;
-            }
-            QListWidget::item:selected {
-                background-color: #4682b4;
-                color: #ffffff;
-            }
-            QListWidget::item:hover {
-                background-color: #f0f8ff;
-                color: #2c5530;
-            }
-            QListWidget::item:selected:hover {
-                background-color: #5a9bd4;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #2c5530;
-            }
-            QScrollBar:vertical {
-                background-color: #d4e9f1;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #7fb069;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #88c999;
-            }
-            QScrollBar:horizontal {
-                background-color: #d4e9f1;
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #7fb069;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #88c999;
-            }
-            QMenuBar {
-                background-color: #a8d5ba;
-                color: #2c5530;
-                border-bottom: 1px solid #7fb069;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 5px 10px;
-            }
-            QMenuBar::item:selected {
-                background-color: #4682b4;
-                color: #ffffff;
-            }
-            QMenu {
-                background-color: #f8fffe;
-                color: #2c5530;
-                border: 1px solid #7fb069;
-            }
-            QMenu::item {
-                padding: 5px 10px;
-            }
-            QMenu::item:selected {
-                background-color: #4682b4;
-                color: #ffffff;
-            }
-            QStatusBar {
-                background-color: #a8d5ba;
-                color: #2c5530;
-                border-top: 1px solid #7fb069;
-            }
-        """)
+        self.setStyleSheet(_NATURE_QSS)
     
     def create_menu_bar(self):
         """Create the menu bar"""
@@ -1669,25 +2089,26 @@ class MainWindow(QMainWindow):
     
     def toggle_dark_mode(self):
         """Toggle between dark mode and nature theme"""
-        self.dark_mode = self.dark_mode_action.isChecked()
+        dark_mode = self.dark_mode_action.isChecked()
+        if dark_mode == self.dark_mode:
+            return  # Nothing to persist or restyle
+        self.dark_mode = dark_mode
         self.settings.setValue("dark_mode", self.dark_mode)
         self.apply_theme()
         
-        # Refresh river details if one is currently selected to update the river name color
-        current_row = self.rivers_table.currentRow()
-        if current_row >= 0:
-            river_id_item = self.rivers_table.item(current_row, 0)
-            if river_id_item:
-                river_id = int(river_id_item.text())
-                river_data = self.db_manager.get_river_by_id(river_id)
-                self.display_river_details(river_data)
+        # Re-render the shown river details to update the river name color
+        if self.current_river_data:
+            self.display_river_details(self.current_river_data)
         
         theme_name = "Dark Mode" if self.dark_mode else "Nature Theme"
         self.status_bar.showMessage(f"Switched to {theme_name}")
     
     def toggle_trip_logs_setting(self):
         """Toggle the trip logs import/export setting"""
-        self.include_trip_logs = self.trip_logs_action.isChecked()
+        include_trip_logs = self.trip_logs_action.isChecked()
+        if include_trip_logs == self.include_trip_logs:
+            return
+        self.include_trip_logs = include_trip_logs
         self.settings.setValue("include_trip_logs", self.include_trip_logs)
         
         status_text = "enabled" if self.include_trip_logs else "disabled"
@@ -1703,15 +2124,29 @@ class MainWindow(QMainWindow):
         # Search and filter section
         search_layout = QHBoxLayout()
         
+        # Filter once typing pauses rather than on every keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(200)
+        self.filter_timer.timeout.connect(self.filter_rivers)
+        
         search_layout.addWidget(QLabel("Search:"))
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search rivers by name, location, or difficulty...")
-        self.search_edit.textChanged.connect(self.filter_rivers)
+        self.search_edit.textChanged.connect(lambda _: self.filter_timer.start())
+        
+        # Suggest river names as the user types; picking one filters right away
+        self.river_names_model = QStringListModel(self)
+        completer = QCompleter(self.river_names_model, self)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        completer.activated.connect(lambda _: self.filter_rivers())
+        self.search_edit.setCompleter(completer)
         search_layout.addWidget(self.search_edit)
         
         search_layout.addWidget(QLabel("Difficulty:"))
         self.difficulty_filter = QComboBox()
-        self.difficulty_filter.addItems(["All", "Class I", "Class II", "Class III", "Class IV", "Class V", "Class VI"])
+        self.difficulty_filter.addItems(_DIFFICULTY_FILTER_OPTIONS)
         self.difficulty_filter.currentTextChanged.connect(self.filter_rivers)
         search_layout.addWidget(self.difficulty_filter)
         
@@ -1744,14 +2179,24 @@ class MainWindow(QMainWindow):
         table_btn_layout.addStretch()
         table_layout.addLayout(table_btn_layout)
         
-        # Rivers table
-        self.rivers_table = QTableWidget()
-        self.rivers_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.rivers_table.itemSelectionChanged.connect(self.river_selection_changed)
+        # Rivers table, backed by a model so rows are only rendered when painted
+        self.rivers_model = RiverTableModel(self)
+        self.rivers_proxy = QSortFilterProxyModel(self)
+        self.rivers_proxy.setSourceModel(self.rivers_model)
+        self.rivers_proxy.setSortRole(RiverTableModel.SORT_ROLE)
+        
+        self.rivers_table = QTableView()
+        self.rivers_table.setModel(self.rivers_proxy)
+        self.rivers_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.rivers_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.rivers_table.selectionModel().selectionChanged.connect(self.river_selection_changed)
         
         # Enable sorting
         self.rivers_table.setSortingEnabled(True)
         
+        # Hide ID column
+        self.rivers_table.hideColumn(0)
+        
         table_layout.addWidget(self.rivers_table)
         
         splitter.addWidget(table_widget)
@@ -1775,12 +2220,18 @@ class MainWindow(QMainWindow):
         # Set splitter proportions - river table stays same, details panel 40% less (from 500 to 300)
         splitter.setSizes([700, 300])
     
+    def on_tab_changed(self, index):
+        """Build a lazily created tab the first time it is shown"""
+        page = self.tab_widget.widget(index)
+        build_tab = self.pending_tabs.pop(page, None)
+        if build_tab:
+            build_tab()
+        elif page is self.stats_page and self.stats_dirty:
+            self.update_statistics()
+    
     def create_trip_logs_tab(self):
         """Create the trip logs tab"""
-        trips_widget = QWidget()
-        self.tab_widget.addTab(trips_widget, "Trip Logs")
-        
-        layout = QVBoxLayout(trips_widget)
+        layout = QVBoxLayout(self.trips_page)
         
         # Trip log buttons
         btn_layout = QHBoxLayout()
@@ -1801,22 +2252,32 @@ class MainWindow(QMainWindow):
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
         
-        # Trip logs table
-        self.trips_table = QTableWidget()
-        self.trips_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.trips_table.itemSelectionChanged.connect(self.trip_selection_changed)
+        # Trip logs table, backed by a model like the rivers table
+        self.trips_model = TripTableModel(self)
+        self.trips_proxy = QSortFilterProxyModel(self)
+        self.trips_proxy.setSourceModel(self.trips_model)
+        self.trips_proxy.setSortRole(TripTableModel.SORT_ROLE)
+        
+        self.trips_table = QTableView()
+        self.trips_table.setModel(self.trips_proxy)
+        self.trips_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.trips_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.trips_table.selectionModel().selectionChanged.connect(self.trip_selection_changed)
         
         # Enable sorting for trip logs table as well
         self.trips_table.setSortingEnabled(True)
         
+        # Hide ID column
+        self.trips_table.hideColumn(0)
+        
         layout.addWidget(self.trips_table)
+        
+        # Load trip logs
+        self.refresh_trips_table()
     
     def create_stats_tab(self):
         """Create the statistics tab"""
-        stats_widget = QWidget()
-        self.tab_widget.addTab(stats_widget, "Statistics")
-        
-        layout = QVBoxLayout(stats_widget)
+        layout = QVBoxLayout(self.stats_page)
         
         # Stats display
         self.stats_display = QTextEdit()
@@ -1828,184 +2289,118 @@ class MainWindow(QMainWindow):
     
     def refresh_rivers_table(self):
         """Refresh the rivers table"""
-        rivers = self.db_manager.get_all_rivers()
-        
-        # Temporarily disable sorting to avoid issues during population
-        self.rivers_table.setSortingEnabled(False)
-        
-        self.rivers_table.setRowCount(len(rivers))
-        self.rivers_table.setColumnCount(7)
-        
-        headers = ["ID", "Name", "Location", "Difficulty", "Length (mi)", "Rating", "Last Updated"]
-        self.rivers_table.setHorizontalHeaderLabels(headers)
-        
-        for row, river in enumerate(rivers):
-            # ID column (hidden)
-            self.rivers_table.setItem(row, 0, QTableWidgetItem(str(river['id'])))
-            
-            # Name column
-            self.rivers_table.setItem(row, 1, QTableWidgetItem(river['name']))
-            
-            # Location column
-            self.rivers_table.setItem(row, 2, QTableWidgetItem(river['location']))
-            
-            # Difficulty column with proper sorting
-            difficulty = river['difficulty_class'] or ''
-            # Create a sort key based on class number for proper difficulty sorting
-            difficulty_sort_key = 0
-            if difficulty == 'Class I':
-                difficulty_sort_key = 1
-            elif difficulty == 'Class II':
-                difficulty_sort_key = 2
-            elif difficulty == 'Class III':
-                difficulty_sort_key = 3
-            elif difficulty == 'Class IV':
-                difficulty_sort_key = 4
-            elif difficulty == 'Class V':
-                difficulty_sort_key = 5
-            elif difficulty == 'Class VI':
-                difficulty_sort_key = 6
-            
-            difficulty_item = SortableTableWidgetItem(difficulty, difficulty_sort_key)
-            self.rivers_table.setItem(row, 3, difficulty_item)
-            
-            # Length column with numeric sorting
-            length = river['length_miles']
-            if length is not None:
-                length_text = f"{length:.1f}"
-                length_item = SortableTableWidgetItem(length_text, length)
-            else:
-                length_item = SortableTableWidgetItem('', -1)  # Empty values sort first
-            self.rivers_table.setItem(row, 4, length_item)
-            
-            # Rating column with numeric sorting
-            rating = river['personal_rating']
-            if rating is not None:
-                rating_text = str(rating)
-                rating_item = SortableTableWidgetItem(rating_text, rating)
-            else:
-                rating_item = SortableTableWidgetItem('', -1)  # Empty values sort first
-            self.rivers_table.setItem(row, 5, rating_item)
-            
-            # Last Updated column
-            self.rivers_table.setItem(row, 6, QTableWidgetItem(river['last_updated'][:10]))
-        
-        # Hide ID column and resize
-        self.rivers_table.hideColumn(0)
-        self.rivers_table.resizeColumnsToContents()
+        self.run_db_task(self.db_manager.get_river_summaries, self.populate_rivers_table)
+    
+    def fit_columns(self, table, min_widths):
+        """Size a table's columns to its contents the first time it has rows"""
+        # Measuring every cell on each refresh is slow for large tables, so later
+        # refreshes keep the current (possibly user-set) widths
+        if table in self.fitted_tables:
+            return
+        if table.model().rowCount():
+            self.fitted_tables.add(table)
+        
+        table.resizeColumnsToContents()
+        header = table.horizontalHeader()
+        for column, width in min_widths.items():
+            header.resizeSection(column, max(header.sectionSize(column), width))
+    
+    def refresh_all_tables(self):
+        """Reload both tables in one database task and update the statistics once"""
+        load_trips = self.trips_page not in self.pending_tabs
+        self.run_db_task(self.load_all_tables, self.populate_all_tables, load_trips)
+    
+    def load_all_tables(self, load_trips):
+        """Load the rows of the rivers table and, if requested, the trip logs table"""
+        trips = self.db_manager.get_trip_logs() if load_trips else None
+        return self.db_manager.get_river_summaries(), trips
+    
+    def populate_all_tables(self, tables):
+        """Fill both tables with rows loaded by load_all_tables"""
+        rivers, trips = tables
+        self.populate_rivers_table(rivers, update_stats=False)
+        if trips is not None:
+            self.populate_trips_table(trips, update_stats=False)
+        self.update_statistics()
+    
+    def populate_rivers_table(self, rivers, update_stats=True):
+        """Fill the rivers table with freshly loaded rows"""
+        self.rivers_model.set_rivers(rivers)
         
-        # Add extra space to narrower columns to accommodate sort arrows
-        header = self.rivers_table.horizontalHeader()
-        header.resizeSection(3, max(header.sectionSize(3), 110))  # Difficulty column
-        header.resizeSection(4, max(header.sectionSize(4), 110))  # Length column  
-        header.resizeSection(5, max(header.sectionSize(5), 70))   # Rating column
-        header.resizeSection(6, max(header.sectionSize(6), 120))  # Last Updated column
+        # Extra space on narrower columns accommodates the sort arrows
+        self.fit_columns(self.rivers_table, {
+            3: 110,  # Difficulty column
+            4: 110,  # Length column
+            5: 70,   # Rating column
+            6: 120,  # Last Updated column
+        })
         
-        # Re-enable sorting
-        self.rivers_table.setSortingEnabled(True)
+        # Store original data for filtering; the table now shows it unfiltered
+        self.original_rivers_data = rivers
+        self.river_names_model.setStringList(sorted({river['name'] for river in rivers}))
         
-        # Add extra space to narrower columns to accommodate sort arrows
-        header = self.rivers_table.horizontalHeader()
-        header.resizeSection(3, max(header.sectionSize(3), 110))  # Difficulty column
-        header.resizeSection(4, max(header.sectionSize(4), 110))  # Length column  
-        header.resizeSection(5, max(header.sectionSize(5), 70))   # Rating column
-        header.resizeSection(6, max(header.sectionSize(6), 120))  # Last Updated column
+        # Lower-cased search text built once per load instead of per river per keystroke
+        self.river_search_entries = [
+            (f"{river['name']} {river['location']} {river['difficulty_class'] or ''}".lower(),
+             river['difficulty_class'], river)
+            for river in rivers
+        ]
+        self.last_filter = ("", "All", self.river_search_entries)
         
-        # Store original data for filtering
-        self.original_rivers_data = rivers
+        if update_stats:
+            self.update_statistics()
     
     def filter_rivers(self):
         """Filter rivers based on search criteria"""
+        self.filter_timer.stop()  # A pending debounced run would repeat this work
         search_text = self.search_edit.text().lower()
         difficulty_filter = self.difficulty_filter.currentText()
         
-        filtered_rivers = []
-        for river in self.original_rivers_data:
-            # Text search
-            if search_text:
-                searchable_text = f"{river['name']} {river['location']} {river['difficulty_class']}".lower()
-                if search_text not in searchable_text:
-                    continue
-            
-            # Difficulty filter
-            if difficulty_filter != "All" and river['difficulty_class'] != difficulty_filter:
-                continue
-            
-            filtered_rivers.append(river)
-        
-        # Temporarily disable sorting to avoid issues during population
-        self.rivers_table.setSortingEnabled(False)
-        
-        # Update table with filtered results
-        self.rivers_table.setRowCount(len(filtered_rivers))
-        
-        for row, river in enumerate(filtered_rivers):
-            # ID column (hidden)
-            self.rivers_table.setItem(row, 0, QTableWidgetItem(str(river['id'])))
-            
-            # Name column
-            self.rivers_table.setItem(row, 1, QTableWidgetItem(river['name']))
-            
-            # Location column
-            self.rivers_table.setItem(row, 2, QTableWidgetItem(river['location']))
-            
-            # Difficulty column with proper sorting
-            difficulty = river['difficulty_class'] or ''
-            # Create a sort key based on class number for proper difficulty sorting
-            difficulty_sort_key = 0
-            if difficulty == 'Class I':
-                difficulty_sort_key = 1
-            elif difficulty == 'Class II':
-                difficulty_sort_key = 2
-            elif difficulty == 'Class III':
-                difficulty_sort_key = 3
-            elif difficulty == 'Class IV':
-                difficulty_sort_key = 4
-            elif difficulty == 'Class V':
-                difficulty_sort_key = 5
-            elif difficulty == 'Class VI':
-                difficulty_sort_key = 6
-            
-            difficulty_item = SortableTableWidgetItem(difficulty, difficulty_sort_key)
-            self.rivers_table.setItem(row, 3, difficulty_item)
-            
-            # Length column with numeric sorting
-            length = river['length_miles']
-            if length is not None:
-                length_text = f"{length:.1f}"
-                length_item = SortableTableWidgetItem(length_text, length)
-            else:
-                length_item = SortableTableWidgetItem('', -1)  # Empty values sort first
-            self.rivers_table.setItem(row, 4, length_item)
-            
-            # Rating column with numeric sorting
-            rating = river['personal_rating']
-            if rating is not None:
-                rating_text = str(rating)
-                rating_item = SortableTableWidgetItem(rating_text, rating)
+        # A query that contains the previous one can only match a subset of the
+        # previous results, so narrow those instead of rescanning every river
+        last_search, last_difficulty, last_filtered = self.last_filter
+        if not search_text and difficulty_filter == "All":
+            self.last_filter = ("", "All", self.river_search_entries)
+            filtered_rivers = self.original_rivers_data
+        else:
+            if difficulty_filter == last_difficulty and last_search in search_text:
+                candidates = last_filtered
             else:
-                rating_item = SortableTableWidgetItem('', -1)  # Empty values sort first
-            self.rivers_table.setItem(row, 5, rating_item)
-            
-            # Last Updated column
-            self.rivers_table.setItem(row, 6, QTableWidgetItem(river['last_updated'][:10]))
+                candidates = self.river_search_entries
+            matches = self.match_rivers(candidates, search_text, difficulty_filter)
+            self.last_filter = (search_text, difficulty_filter, matches)
+            filtered_rivers = [river for _, _, river in matches]
         
-        # Re-enable sorting
-        self.rivers_table.setSortingEnabled(True)
+        # Update table with filtered results
+        self.rivers_model.show_rivers(filtered_rivers)
+    
+    def match_rivers(self, entries, search_text, difficulty_filter):
+        """Get the search entries matching a lower-cased search text and difficulty filter"""
+        if difficulty_filter == "All":
+            return [entry for entry in entries if search_text in entry[0]]
+        if not search_text:
+            return [entry for entry in entries if entry[1] == difficulty_filter]
+        return [entry for entry in entries if entry[1] == difficulty_filter and search_text in entry[0]]
+    
+    def selected_river(self):
+        """Get the list row of the currently selected river, if any"""
+        index = self.rivers_table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.rivers_model.river_at(self.rivers_proxy.mapToSource(index).row())
     
     def river_selection_changed(self):
         """Handle river selection change"""
-        current_row = self.rivers_table.currentRow()
-        if current_row >= 0:
-            river_id_item = self.rivers_table.item(current_row, 0)
-            if river_id_item:
-                river_id = int(river_id_item.text())
-                river_data = self.db_manager.get_river_by_id(river_id)
-                self.display_river_details(river_data)
-                self.file_attachment_widget.set_river(river_id, self.db_manager)
+        river = self.selected_river()
+        if river:
+            river_id = river['id']
+            river_data = self.db_manager.get_river_by_id(river_id)
+            self.display_river_details(river_data)
+            self.file_attachment_widget.set_river(river_id, self.db_manager)
     
     def display_river_details(self, river_data):
         """Display detailed river information"""
+        self.current_river_data = river_data  # Kept to re-render on theme changes
         if not river_data:
             self.river_details.clear()
             return
@@ -2015,48 +2410,31 @@ class MainWindow(QMainWindow):
         
         # Get difficulty and apply color coding
         difficulty = river_data.get('difficulty_class', '')
-        difficulty_styled = difficulty
-        
-        if difficulty in ['Class I', 'Class II']:
-            difficulty_styled = f'<span style="color: green; font-weight: bold;">{difficulty}</span>'
-        elif difficulty == 'Class III':
-            difficulty_styled = f'<span style="color: orange; font-weight: bold;">{difficulty}</span>'
-        elif difficulty in ['Class IV', 'Class V']:
-            difficulty_styled = f'<span style="color: red; font-weight: bold;">{difficulty}</span>'
-        elif difficulty == 'Class VI':
-            difficulty_styled = f'<span style="color: #C71585; font-weight: bold;">{difficulty}</span>'  # Changed to pinkish purple without underline
-        
-        # Helper function to check if a field has meaningful data
-        def has_data(value):
-            if value is None:
-                return False
-            if isinstance(value, (int, float)):
-                return True  # All numeric values are valid (including 0)
-            return value and str(value).strip() and str(value).strip().lower() != 'n/a'
+        difficulty_styled = _DIFFICULTY_HTML.get(difficulty, difficulty)
         
         # Start building the HTML
-        details_html = f'<h2 style="color: {river_name_color};">{river_data["name"]}</h2>'
+        parts = [f'<h2 style="color: {river_name_color};">{river_data["name"]}</h2>']
         
         # Always show location (required field)
-        details_html += f'<p><strong>Location:</strong> {river_data["location"]}</p>'
+        parts.append(f'<p><strong>Location:</strong> {river_data["location"]}</p>')
         
         # Show coordinates if available
         lat = river_data.get('latitude')
         lon = river_data.get('longitude')
-        if has_data(lat) or has_data(lon):
-            lat_text = f"{lat:.6f}" if has_data(lat) else "?"
-            lon_text = f"{lon:.6f}" if has_data(lon) else "?"
-            details_html += f'<p><strong>Coordinates:</strong> {lat_text}, {lon_text}</p>'
+        if _has_data(lat) or _has_data(lon):
+            lat_text = f"{lat:.6f}" if _has_data(lat) else "?"
+            lon_text = f"{lon:.6f}" if _has_data(lon) else "?"
+            parts.append(f'<p><strong>Coordinates:</strong> {lat_text}, {lon_text}</p>')
         
         # Conditionally show other basic info
-        if has_data(river_data.get('region')):
-            details_html += f'<p><strong>Region:</strong> {river_data["region"]}</p>'
+        if _has_data(river_data.get('region')):
+            parts.append(f'<p><strong>Region:</strong> {river_data["region"]}</p>')
         
-        if has_data(difficulty):
-            details_html += f'<p><strong>Difficulty:</strong> {difficulty_styled}</p>'
+        if _has_data(difficulty):
+            parts.append(f'<p><strong>Difficulty:</strong> {difficulty_styled}</p>')
         
-        if has_data(river_data.get('length_miles')):
-            details_html += f'<p><strong>Length:</strong> {river_data["length_miles"]} miles</p>'
+        if _has_data(river_data.get('length_miles')):
+            parts.append(f'<p><strong>Length:</strong> {river_data["length_miles"]} miles</p>')
         
         # Water Level Information section - show both flow rate and depth if available
         water_level_fields = []
@@ -2064,75 +2442,75 @@ class MainWindow(QMainWindow):
         # Flow range - only show if we have at least one value
         flow_min = river_data.get('typical_flow_min')
         flow_max = river_data.get('typical_flow_max')
-        if has_data(flow_min) or has_data(flow_max):
-            flow_min_text = str(flow_min) if has_data(flow_min) else '?'
-            flow_max_text = str(flow_max) if has_data(flow_max) else '?'
+        if _has_data(flow_min) or _has_data(flow_max):
+            flow_min_text = str(flow_min) if _has_data(flow_min) else '?'
+            flow_max_text = str(flow_max) if _has_data(flow_max) else '?'
             water_level_fields.append(f'<p><strong>Flow Range:</strong> {flow_min_text} - {flow_max_text} cfs</p>')
         
         # Water depth range - only show if we have at least one value
         depth_min = river_data.get('water_depth_min')
         depth_max = river_data.get('water_depth_max')
-        if has_data(depth_min) or has_data(depth_max):
-            depth_min_text = str(depth_min) if has_data(depth_min) else '?'
-            depth_max_text = str(depth_max) if has_data(depth_max) else '?'
+        if _has_data(depth_min) or _has_data(depth_max):
+            depth_min_text = str(depth_min) if _has_data(depth_min) else '?'
+            depth_max_text = str(depth_max) if _has_data(depth_max) else '?'
             water_level_fields.append(f'<p><strong>Water Depth Range:</strong> {depth_min_text} - {depth_max_text} ft</p>')
         
         # Add water level section if we have any water level info
         if water_level_fields:
-            details_html += '<h3 style="color: #4682b4;">Water Level Information</h3>'
-            details_html += ''.join(water_level_fields)
+            parts.append(_DETAILS_HEADING.format('Water Level Information'))
+            parts.extend(water_level_fields)
         
-        if has_data(river_data.get('personal_rating')):
-            details_html += f'<p><strong>Personal Rating:</strong> {river_data["personal_rating"]}/5</p>'
+        if _has_data(river_data.get('personal_rating')):
+            parts.append(f'<p><strong>Personal Rating:</strong> {river_data["personal_rating"]}/5</p>')
         
         # Access Information section - only show if we have at least one field
         access_fields = []
-        if has_data(river_data.get('put_in_location')):
+        if _has_data(river_data.get('put_in_location')):
             access_fields.append(f'<p><strong>Put-in:</strong> {river_data["put_in_location"]}</p>')
-        if has_data(river_data.get('take_out_location')):
+        if _has_data(river_data.get('take_out_location')):
             access_fields.append(f'<p><strong>Take-out:</strong> {river_data["take_out_location"]}</p>')
-        if has_data(river_data.get('shuttle_info')):
+        if _has_data(river_data.get('shuttle_info')):
             access_fields.append(f'<p><strong>Shuttle Info:</strong> {river_data["shuttle_info"]}</p>')
-        if has_data(river_data.get('parking_details')):
+        if _has_data(river_data.get('parking_details')):
             access_fields.append(f'<p><strong>Parking:</strong> {river_data["parking_details"]}</p>')
         
         if access_fields:
-            details_html += '<h3 style="color: #4682b4;">Access Information</h3>'
-            details_html += ''.join(access_fields)
+            parts.append(_DETAILS_HEADING.format('Access Information'))
+            parts.extend(access_fields)
         
         # Conditions & Safety section - only show if we have at least one field
         safety_fields = []
-        if has_data(river_data.get('best_seasons')):
+        if _has_data(river_data.get('best_seasons')):
             safety_fields.append(f'<p><strong>Best Seasons:</strong> {river_data["best_seasons"]}</p>')
-        if has_data(river_data.get('water_level_source')):
+        if _has_data(river_data.get('water_level_source')):
             safety_fields.append(f'<p><strong>Water Level Source:</strong> {river_data["water_level_source"]}</p>')
-        if has_data(river_data.get('hazards')):
+        if _has_data(river_data.get('hazards')):
             safety_fields.append(f'<p><strong>Hazards:</strong> {river_data["hazards"]}</p>')
-        if has_data(river_data.get('portages')):
+        if _has_data(river_data.get('portages')):
             safety_fields.append(f'<p><strong>Portages:</strong> {river_data["portages"]}</p>')
-        if has_data(river_data.get('emergency_contacts')):
+        if _has_data(river_data.get('emergency_contacts')):
             safety_fields.append(f'<p><strong>Emergency Contacts:</strong> {river_data["emergency_contacts"]}</p>')
         
         if safety_fields:
-            details_html += '<h3 style="color: #4682b4;">Conditions & Safety</h3>'
-            details_html += ''.join(safety_fields)
+            parts.append(_DETAILS_HEADING.format('Conditions & Safety'))
+            parts.extend(safety_fields)
         
         # Description section
-        if has_data(river_data.get('description')):
-            details_html += '<h3 style="color: #4682b4;">Description</h3>'
-            details_html += f'<p>{river_data["description"]}</p>'
+        if _has_data(river_data.get('description')):
+            parts.append(_DETAILS_HEADING.format('Description'))
+            parts.append(f'<p>{river_data["description"]}</p>')
         
         # Personal Notes section
-        if has_data(river_data.get('notes')):
-            details_html += '<h3 style="color: #4682b4;">Personal Notes</h3>'
-            details_html += f'<p>{river_data["notes"]}</p>'
+        if _has_data(river_data.get('notes')):
+            parts.append(_DETAILS_HEADING.format('Personal Notes'))
+            parts.append(f'<p>{river_data["notes"]}</p>')
         
         # Tags section
-        if has_data(river_data.get('tags')):
-            details_html += '<h3 style="color: #4682b4;">Tags</h3>'
-            details_html += f'<p>{river_data["tags"]}</p>'
+        if _has_data(river_data.get('tags')):
+            parts.append(_DETAILS_HEADING.format('Tags'))
+            parts.append(f'<p>{river_data["tags"]}</p>')
         
-        self.river_details.setHtml(details_html)
+        self.river_details.setHtml(''.join(parts))
     
     def add_river(self):
         """Add a new river"""
@@ -2147,20 +2525,18 @@ class MainWindow(QMainWindow):
             try:
                 self.db_manager.add_river(river_data)
                 self.refresh_rivers_table()
-                self.update_statistics()
                 self.status_bar.showMessage(f"River '{river_data['name']}' added successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to add river: {str(e)}")
     
     def edit_river(self):
         """Edit the selected river"""
-        current_row = self.rivers_table.currentRow()
-        if current_row < 0:
+        river = self.selected_river()
+        if not river:
             QMessageBox.warning(self, "No Selection", "Please select a river to edit.")
             return
         
-        river_id_item = self.rivers_table.item(current_row, 0)
-        river_id = int(river_id_item.text())
+        river_id = river['id']
         river_data = self.db_manager.get_river_by_id(river_id)
         
         dialog = RiverFormDialog(self, river_data)
@@ -2173,22 +2549,21 @@ class MainWindow(QMainWindow):
             
             try:
                 self.db_manager.update_river(river_id, updated_data)
-                self.refresh_rivers_table()
+                self.refresh_all_tables()  # Trip rows show the river name
                 self.display_river_details(self.db_manager.get_river_by_id(river_id))
-                self.update_statistics()  # Refresh statistics to reflect changes
                 self.status_bar.showMessage(f"River '{updated_data['name']}' updated successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to update river: {str(e)}")
     
     def delete_river(self):
         """Delete the selected river"""
-        current_row = self.rivers_table.currentRow()
-        if current_row < 0:
+        river = self.selected_river()
+        if not river:
             QMessageBox.warning(self, "No Selection", "Please select a river to delete.")
             return
         
-        river_name = self.rivers_table.item(current_row, 1).text()
-        river_id = int(self.rivers_table.item(current_row, 0).text())
+        river_name = river['name']
+        river_id = river['id']
         
         reply = QMessageBox.question(
             self,
@@ -2200,18 +2575,23 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.db_manager.delete_river(river_id)
-                self.refresh_rivers_table()
-                self.river_details.clear()
+                self.refresh_all_tables()  # The river's trips were deleted with it
+                self.display_river_details(None)
                 self.file_attachment_widget.set_river(None, None)
-                self.update_statistics()
                 self.status_bar.showMessage(f"River '{river_name}' deleted successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete river: {str(e)}")
     
+    def selected_trip(self):
+        """Get the list row of the currently selected trip, if any"""
+        index = self.trips_table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.trips_model.trip_at(self.trips_proxy.mapToSource(index).row())
+    
     def trip_selection_changed(self):
         """Handle trip selection change"""
-        current_row = self.trips_table.currentRow()
-        if current_row >= 0:
+        if self.selected_trip():
             # Enable edit and delete buttons when a trip is selected
             self.edit_trip_btn.setEnabled(True)
             self.delete_trip_btn.setEnabled(True)
@@ -2222,20 +2602,19 @@ class MainWindow(QMainWindow):
     
     def edit_trip_log(self):
         """Edit the selected trip log"""
-        current_row = self.trips_table.currentRow()
-        if current_row < 0:
+        trip = self.selected_trip()
+        if not trip:
             QMessageBox.warning(self, "No Selection", "Please select a trip to edit.")
             return
         
-        trip_id_item = self.trips_table.item(current_row, 0)
-        trip_id = int(trip_id_item.text())
+        trip_id = trip['id']
         trip_data = self.db_manager.get_trip_log_by_id(trip_id)
         
         if not trip_data:
             QMessageBox.warning(self, "Error", "Could not load trip data.")
             return
         
-        rivers = self.db_manager.get_all_rivers()
+        rivers = self.db_manager.get_river_summaries()
         dialog = TripLogDialog(self, rivers, trip_data.get('river_id'), trip_data)
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -2244,21 +2623,20 @@ class MainWindow(QMainWindow):
             try:
                 self.db_manager.update_trip_log(trip_id, updated_data)
                 self.refresh_trips_table()
-                self.update_statistics()
                 self.status_bar.showMessage("Trip log updated successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to update trip log: {str(e)}")
     
     def delete_trip_log(self):
         """Delete the selected trip log"""
-        current_row = self.trips_table.currentRow()
-        if current_row < 0:
+        trip = self.selected_trip()
+        if not trip:
             QMessageBox.warning(self, "No Selection", "Please select a trip to delete.")
             return
         
-        trip_id = int(self.trips_table.item(current_row, 0).text())
-        river_name = self.trips_table.item(current_row, 1).text()
-        trip_date = self.trips_table.item(current_row, 2).text()
+        trip_id = trip['id']
+        river_name = trip['river_name']
+        trip_date = trip['trip_date']
         
         reply = QMessageBox.question(
             self,
@@ -2271,14 +2649,13 @@ class MainWindow(QMainWindow):
             try:
                 self.db_manager.delete_trip_log(trip_id)
                 self.refresh_trips_table()
-                self.update_statistics()
                 self.status_bar.showMessage("Trip log deleted successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete trip log: {str(e)}")
 
     def add_trip_log(self):
         """Add a new trip log"""
-        rivers = self.db_manager.get_all_rivers()
+        rivers = self.db_manager.get_river_summaries()  # The dialog only needs ids and names
         if not rivers:
             QMessageBox.warning(self, "No Rivers", "Please add some rivers first before logging trips.")
             return
@@ -2286,9 +2663,9 @@ class MainWindow(QMainWindow):
         # Check if a river is selected in the rivers tab
         selected_river_id = None
         if self.tab_widget.currentIndex() == 0:  # Rivers tab
-            current_row = self.rivers_table.currentRow()
-            if current_row >= 0:
-                selected_river_id = int(self.rivers_table.item(current_row, 0).text())
+            river = self.selected_river()
+            if river:
+                selected_river_id = river['id']
         
         dialog = TripLogDialog(self, rivers, selected_river_id)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -2297,101 +2674,54 @@ class MainWindow(QMainWindow):
             try:
                 self.db_manager.add_trip_log(trip_data)
                 self.refresh_trips_table()
-                self.update_statistics()
                 self.status_bar.showMessage("Trip log added successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to add trip log: {str(e)}")
     
     def refresh_trips_table(self):
-        """Refresh the trip logs table"""
-        trips = self.db_manager.get_trip_logs()
-        
-        # Temporarily disable sorting to avoid issues during population
-        self.trips_table.setSortingEnabled(False)
-        
-        self.trips_table.setRowCount(len(trips))
-        self.trips_table.setColumnCount(8)
-        
-        headers = ["ID", "River", "Date", "Companions", "Duration", "Rating", "Water Level", "Weather"]
-        self.trips_table.setHorizontalHeaderLabels(headers)
-        
-        for row, trip in enumerate(trips):
-            # ID column (hidden)
-            self.trips_table.setItem(row, 0, QTableWidgetItem(str(trip['id'])))
-            
-            # River name column
-            self.trips_table.setItem(row, 1, QTableWidgetItem(trip['river_name']))
-            
-            # Date column
-            self.trips_table.setItem(row, 2, QTableWidgetItem(trip['trip_date']))
-            
-            # Companions column
-            self.trips_table.setItem(row, 3, QTableWidgetItem(trip['companions'] or ''))
-            
-            # Duration column with numeric sorting
-            duration = trip['duration_hours']
-            if duration is not None:
-                duration_text = f"{duration:.1f}h"
-                duration_item = SortableTableWidgetItem(duration_text, duration)
-            else:
-                duration_item = SortableTableWidgetItem('', -1)  # Empty values sort first
-            self.trips_table.setItem(row, 4, duration_item)
-            
-            # Rating column with numeric sorting
-            rating = trip['trip_rating']
-            if rating is not None:
-                rating_text = str(rating)
-                rating_item = SortableTableWidgetItem(rating_text, rating)
-            else:
-                rating_item = SortableTableWidgetItem('', -1)  # Empty values sort first
-            self.trips_table.setItem(row, 5, rating_item)
-            
-            # Water level column
-            self.trips_table.setItem(row, 6, QTableWidgetItem(trip['water_level'] or ''))
-            
-            # Weather column
-            self.trips_table.setItem(row, 7, QTableWidgetItem(trip['weather_conditions'] or ''))
-        
-        # Hide ID column and resize
-        self.trips_table.hideColumn(0)
-        self.trips_table.resizeColumnsToContents()
-        
-        # Add extra space to narrower columns to accommodate sort arrows
-        header = self.trips_table.horizontalHeader()
-        header.resizeSection(2, max(header.sectionSize(2), 90))   # Date column
-        header.resizeSection(4, max(header.sectionSize(4), 90))   # Duration column
-        header.resizeSection(5, max(header.sectionSize(5), 70))   # Rating column
+        """Reload the trip logs table"""
+        if self.trips_page in self.pending_tabs:
+            # The table loads when the tab is first shown, but the trips changed the statistics
+            self.update_statistics()
+            return
+        self.run_db_task(self.db_manager.get_trip_logs, self.populate_trips_table)
+    
+    def populate_trips_table(self, trips, update_stats=True):
+        """Fill the trip logs table with freshly loaded rows"""
+        self.trips_model.set_trips(trips)
         
-        # Re-enable sorting
-        self.trips_table.setSortingEnabled(True)
+        # Extra space on narrower columns accommodates the sort arrows
+        self.fit_columns(self.trips_table, {
+            2: 90,   # Date column
+            4: 90,   # Duration column
+            5: 70,   # Rating column
+        })
         
         # Disable edit and delete buttons by default (no selection)
-        if hasattr(self, 'edit_trip_btn'):
-            self.edit_trip_btn.setEnabled(False)
-        if hasattr(self, 'delete_trip_btn'):
-            self.delete_trip_btn.setEnabled(False)
+        self.edit_trip_btn.setEnabled(False)
+        self.delete_trip_btn.setEnabled(False)
+        
+        if update_stats:
+            self.update_statistics()  # Trip changes change the statistics
     
     def update_statistics(self):
-        """Update the statistics display"""
-        rivers = self.db_manager.get_all_rivers()
-        trips = self.db_manager.get_trip_logs()
-        
-        # Basic counts
-        total_rivers = len(rivers)
-        total_trips = len(trips)
-        
-        # Difficulty breakdown
-        difficulty_counts = {}
-        for river in rivers:
-            diff = river['difficulty_class'] or 'Unknown'
-            difficulty_counts[diff] = difficulty_counts.get(diff, 0) + 1
-        
-        # Rating statistics
-        ratings = [r['personal_rating'] for r in rivers if r['personal_rating']]
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
-        
-        # Trip statistics
-        total_trip_hours = sum(t['duration_hours'] for t in trips if t['duration_hours'])
+        """Update the statistics display from aggregates computed by the database"""
+        if self.stats_page in self.pending_tabs:
+            return  # Shown once the tab is built
+        if self.tab_widget.currentWidget() is not self.stats_page:
+            self.stats_dirty = True  # Rendered when the tab is next shown
+            return
+        self.stats_dirty = False
+        self.run_db_task(self.db_manager.get_stats, self.display_statistics)
+    
+    def display_statistics(self, stats):
+        """Render statistics returned by get_stats"""
+        total_rivers = stats['total_rivers']
+        total_trips = stats['total_trips']
+        avg_rating = stats['avg_rating']
+        total_trip_hours = stats['total_trip_hours']
+        difficulty_counts = stats['difficulty_counts']
+        recent_trips = stats['recent_trips']
         
         # Generate statistics HTML
         stats_html = f"""
@@ -2423,7 +2753,6 @@ class MainWindow(QMainWindow):
         <ul>
         """
         
-        recent_trips = sorted(trips, key=lambda x: x['trip_date'], reverse=True)[:5]
         for trip in recent_trips:
             stats_html += f"<li>{trip['trip_date']} - {trip['river_name']}</li>"
         
@@ -2442,23 +2771,21 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
-                export_data = {
-                    'rivers': self.db_manager.get_all_rivers(),
-                    'export_date': datetime.now().isoformat(),
-                    'includes_trip_logs': self.include_trip_logs
-                }
-                
-                # Only include trip logs if the setting is enabled
-                if self.include_trip_logs:
-                    export_data['trips'] = self.db_manager.get_trip_logs()
-                
-                with open(file_path, 'w') as f:
-                    json.dump(export_data, f, indent=2, default=str)
+                # Write rows as they are read rather than building the whole export in memory
+                with open(file_path, 'wb') as f:
+                    f.write(b'{\n"export_date": ' + _json_dumps(datetime.now().isoformat()))
+                    f.write(b',\n"includes_trip_logs": ' + _json_dumps(self.include_trip_logs))
+                    f.write(b',\n"rivers": ')
+                    rivers_count = _write_json_rows(f, self.db_manager.iter_rivers())
+                    
+                    # Only include trip logs if the setting is enabled
+                    trips_count = 0
+                    if self.include_trip_logs:
+                        f.write(b',\n"trips": ')
+                        trips_count = _write_json_rows(f, self.db_manager.iter_trip_logs())
+                    f.write(b'\n}\n')
                 
                 # Show what was exported
-                rivers_count = len(export_data['rivers'])
-                trips_count = len(export_data.get('trips', []))
-                
                 if self.include_trip_logs:
                     message = f"Data exported successfully!\n\nRivers: {rivers_count}\nTrip Logs: {trips_count}\n\nFile: {file_path}"
                 else:
@@ -2481,202 +2808,223 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         
+        # Reading and inserting run on the database worker so the window stays responsive
+        self.status_bar.showMessage("Importing data...")
+        self.run_db_task(self.import_file, self.show_import_summary, file_path, self.include_trip_logs)
+    
+    def import_file(self, file_path, include_trip_logs):
+        """Import an export file on the database worker and return its counts, plus the error to report if it failed"""
+        # Each chunk commits on its own, so the counts so far are reported even if the import fails
+        result = {
+            'include_trip_logs': include_trip_logs,
+            'rivers_imported': 0,
+            'rivers_skipped': 0,
+            'trips_imported': 0,
+            'trips_skipped': 0,
+        }
         try:
-            with open(file_path, 'r') as f:
-                import_data = json.load(f)
-            
             # Validate the JSON structure
-            if not isinstance(import_data, dict) or 'rivers' not in import_data:
-                QMessageBox.critical(self, "Invalid File", "The selected file does not contain valid River Runner data.")
-                return
-            
-            rivers_data = import_data.get('rivers', [])
-            trips_data = import_data.get('trips', [])
-            
-            # Import rivers first
-            rivers_imported, rivers_skipped = self.import_rivers(rivers_data)
+            export = _read_export(file_path)
+            if export is None:
+                result['error'] = ("Invalid File", "The selected file does not contain valid River Runner data.")
+                return result
+            rivers_data, trips_data = export
             
-            # Only import trips if the setting is enabled AND trip data exists in the file
-            trips_imported, trips_skipped = 0, 0
-            if self.include_trip_logs and trips_data:
-                trips_imported, trips_skipped = self.import_trips(trips_data)
-            elif not self.include_trip_logs and trips_data:
-                trips_skipped = len(trips_data)  # Count as skipped since setting is disabled
+            # Import rivers first; large files are read as they are imported
+            self.import_rivers(rivers_data, result)
             
-            # Show summary
-            summary_msg = f"Import completed successfully!\n\n"
-            summary_msg += f"{'='*50}\n"
-            summary_msg += f"RIVERS:\n"
-            summary_msg += f"  • Imported:              {rivers_imported}\n"
-            summary_msg += f"  • Skipped (duplicates):  {rivers_skipped}\n\n"
-            summary_msg += f"TRIP LOGS:\n"
-            if self.include_trip_logs:
-                summary_msg += f"  • Imported:              {trips_imported}\n"
-                summary_msg += f"  • Skipped (duplicates):  {trips_skipped}\n"
+            # Only import trips if the setting is enabled
+            if include_trip_logs:
+                self.import_trips(trips_data, result)
             else:
-                summary_msg += f"  • Skipped (setting disabled): {len(trips_data) if trips_data else 0}\n"
-            summary_msg += f"{'='*50}"
+                result['trips_skipped'] = sum(1 for _ in trips_data)  # Count as skipped since setting is disabled
             
-            if not self.include_trip_logs and trips_data:
-                summary_msg += f"\n\nNote: Trip log import is disabled in Settings.\nTo import trip logs, enable 'Import/Export Trip Logs' in the Settings menu."
-            
-            # Create a custom message box with wider dimensions
-            msg_box = QMessageBox(self)
-            msg_box.setWindowTitle("Import Complete")
-            msg_box.setText(summary_msg)
-            msg_box.setIcon(QMessageBox.Icon.Information)
-            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        except _JSON_ERRORS:
+            result['error'] = ("Invalid File", "The selected file is not a valid JSON file.")
+        except Exception as e:
+            result['error'] = ("Error", f"Failed to import data: {str(e)}")
+        
+        return result
+    
+    def show_import_summary(self, result):
+        """Report a finished import and show the imported rows"""
+        include_trip_logs = result['include_trip_logs']
+        rivers_imported = result['rivers_imported']
+        trips_imported = result['trips_imported']
+        trips_skipped = result['trips_skipped']
+        
+        if 'error' in result:
+            self.status_bar.clearMessage()
+            title, message = result['error']
+            if rivers_imported or trips_imported:
+                message += f"\n\n{rivers_imported} rivers and {trips_imported} trips were imported before the error."
+            QMessageBox.critical(self, title, message)
+            self.refresh_imported_tables(rivers_imported, trips_imported)
+            return
+        
+        # Show summary
+        separator = '=' * 50
+        lines = [
+            "Import completed successfully!",
+            "",
+            separator,
+            "RIVERS:",
+            f"  • Imported:              {rivers_imported}",
+            f"  • Skipped (duplicates):  {result['rivers_skipped']}",
+            "",
+            "TRIP LOGS:",
+        ]
+        if include_trip_logs:
+            lines.append(f"  • Imported:              {trips_imported}")
+            lines.append(f"  • Skipped (duplicates):  {trips_skipped}")
+        else:
+            lines.append(f"  • Skipped (setting disabled): {trips_skipped}")
+        lines.append(separator)
+        
+        if not include_trip_logs and trips_skipped:
+            lines.append("")
+            lines.append("Note: Trip log import is disabled in Settings.")
+            lines.append("To import trip logs, enable 'Import/Export Trip Logs' in the Settings menu.")
+        summary_msg = "\n".join(lines)
+        
+        # Create a custom message box with wider dimensions the first time, then reuse it
+        if self.import_summary_box is None:
+            self.import_summary_box = QMessageBox(self)
+            self.import_summary_box.setWindowTitle("Import Complete")
+            self.import_summary_box.setIcon(QMessageBox.Icon.Information)
+            self.import_summary_box.setStandardButtons(QMessageBox.StandardButton.Ok)
             
             # Make the message box wider
-            msg_box.setStyleSheet("QMessageBox { min-width: 400px; }")
-            msg_box.exec()
-            
-            # Refresh the UI
-            self.refresh_rivers_table()
+            self.import_summary_box.setStyleSheet("QMessageBox { min-width: 400px; }")
+        self.import_summary_box.setText(summary_msg)
+        self.import_summary_box.exec()
+        
+        self.refresh_imported_tables(rivers_imported, trips_imported)
+        
+        self.status_bar.showMessage(f"Imported {rivers_imported} rivers and {trips_imported} trips")
+    
+    def refresh_imported_tables(self, rivers_imported, trips_imported):
+        """Refresh only what an import changed; a file of duplicates changes nothing"""
+        if rivers_imported:
+            self.refresh_all_tables()
+        elif trips_imported:
             self.refresh_trips_table()
-            self.update_statistics()
-            
-            self.status_bar.showMessage(f"Imported {rivers_imported} rivers and {trips_imported} trips")
-            
-        except json.JSONDecodeError:
-            QMessageBox.critical(self, "Invalid File", "The selected file is not a valid JSON file.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to import data: {str(e)}")
     
-    def import_rivers(self, rivers_data):
-        """Import rivers and return counts of imported and skipped"""
-        imported_count = 0
+    def import_rivers(self, rivers_data, result):
+        """Import rivers, recording the imported and skipped counts in result as each chunk commits"""
         skipped_count = 0
         
-        existing_rivers = self.db_manager.get_all_rivers()
-        
-        # Create a set of existing river identifiers (name + location)
-        existing_identifiers = set()
-        for river in existing_rivers:
-            identifier = f"{river['name'].lower().strip()}|{river['location'].lower().strip()}"
-            existing_identifiers.add(identifier)
+        # Existing river identifiers (name + location)
+        existing_identifiers = self.db_manager.get_river_identifiers()
         
-        for river_data in rivers_data:
-            # Create identifier for this river
-            river_name = river_data.get('name', '').lower().strip()
-            river_location = river_data.get('location', '').lower().strip()
-            identifier = f"{river_name}|{river_location}"
-            
-            # Skip if this river already exists
-            if identifier in existing_identifiers:
-                skipped_count += 1
-                continue
-            
-            # Remove the ID field if it exists (we want new IDs)
-            import_river = dict(river_data)
-            if 'id' in import_river:
-                del import_river['id']
-            if 'date_added' in import_river:
-                del import_river['date_added']
-            if 'last_updated' in import_river:
-                del import_river['last_updated']
-            
-            try:
-                self.db_manager.add_river(import_river)
+        def new_rivers():
+            nonlocal skipped_count
+            for river_data in rivers_data:
+                # Create identifier for this river
+                identifier = _river_identifier(river_data.get('name', ''), river_data.get('location', ''))
+                
+                # Skip if this river already exists
+                if identifier in existing_identifiers:
+                    skipped_count += 1
+                    continue
+                
                 existing_identifiers.add(identifier)  # Add to set to prevent duplicates within import
-                imported_count += 1
-            except Exception as e:
-                print(f"Error importing river {river_data.get('name', 'Unknown')}: {e}")
-                skipped_count += 1
+                yield river_data  # IDs and dates are not copied; new ones are assigned
+        
+        def on_progress(count):
+            result['rivers_imported'] = count
+            result['rivers_skipped'] = skipped_count
+            self.db_signals.progress.emit(f"Importing data... {count} rivers")
         
-        return imported_count, skipped_count
+        # Insert the new rivers a chunk per transaction
+        # Records the database can't store are skipped too
+        result['rivers_imported'], unstorable = self.db_manager.add_rivers_bulk(new_rivers(), on_progress)
+        result['rivers_skipped'] = skipped_count + unstorable
     
-    def import_trips(self, trips_data):
-        """Import trip logs and return counts of imported and skipped"""
-        imported_count = 0
+    def import_trips(self, trips_data, result):
+        """Import trip logs, recording the imported and skipped counts in result as each chunk commits"""
         skipped_count = 0
         
-        # Get current rivers to map names to IDs
-        current_rivers = self.db_manager.get_all_rivers()
-        river_name_to_id = {river['name'].lower().strip(): river['id'] for river in current_rivers}
-        
-        # Get existing trips to check for duplicates
-        existing_trips = self.db_manager.get_trip_logs()
-        existing_trip_identifiers = set()
-        for trip in existing_trips:
-            identifier = f"{trip['river_id']}|{trip['trip_date']}"
-            existing_trip_identifiers.add(identifier)
-        
-        for trip_data in trips_data:
-            # Map river name to current river ID
-            river_name = trip_data.get('river_name', '').lower().strip()
-            if river_name not in river_name_to_id:
-                skipped_count += 1  # Skip if river doesn't exist
-                continue
-            
-            new_river_id = river_name_to_id[river_name]
-            trip_date = trip_data.get('trip_date', '')
-            
-            # Check for duplicate (same river and date)
-            identifier = f"{new_river_id}|{trip_date}"
-            if identifier in existing_trip_identifiers:
-                skipped_count += 1
-                continue
-            
-            # Prepare trip data for import
-            import_trip = dict(trip_data)
-            import_trip['river_id'] = new_river_id
-            
-            # Remove fields that shouldn't be imported
-            fields_to_remove = ['id', 'river_name', 'created_date']
-            for field in fields_to_remove:
-                if field in import_trip:
-                    del import_trip[field]
-            
-            try:
-                self.db_manager.add_trip_log(import_trip)
+        # Map current river names to IDs
+        river_name_to_id = self.db_manager.get_river_ids_by_name()
+        
+        # Existing trip identifiers (river + date) to check for duplicates
+        existing_trip_identifiers = self.db_manager.get_trip_identifiers()
+        
+        def new_trips():
+            nonlocal skipped_count
+            for trip_data in trips_data:
+                # Map river name to current river ID
+                river_name = trip_data.get('river_name', '').lower().strip()
+                if river_name not in river_name_to_id:
+                    skipped_count += 1  # Skip if river doesn't exist
+                    continue
+                
+                new_river_id = river_name_to_id[river_name]
+                trip_date = trip_data.get('trip_date', '')
+                if trip_date is None:
+                    skipped_count += 1  # A trip needs a date
+                    continue
+                
+                # Check for duplicate (same river and date)
+                identifier = (new_river_id, trip_date)
+                if identifier in existing_trip_identifiers:
+                    skipped_count += 1
+                    continue
+                
+                # Point the freshly decoded record at the current river; its ID and creation date are not copied
+                trip_data['river_id'] = new_river_id
+                
                 existing_trip_identifiers.add(identifier)  # Add to set to prevent duplicates within import
-                imported_count += 1
-            except Exception as e:
-                print(f"Error importing trip for {trip_data.get('river_name', 'Unknown')}: {e}")
-                skipped_count += 1
+                yield trip_data
         
-        return imported_count, skipped_count
+        def on_progress(count):
+            result['trips_imported'] = count
+            result['trips_skipped'] = skipped_count
+            self.db_signals.progress.emit(f"Importing data... {count} trips")
+        
+        # Insert the new trips a chunk per transaction
+        result['trips_imported'], unstorable = self.db_manager.add_trip_logs_bulk(new_trips(), on_progress)
+        result['trips_skipped'] = skipped_count + unstorable
     
     def show_data_location(self):
         """Show the user where their data is stored"""
         app_dir = get_app_data_dir()
-        db_path = self.db_manager.db_path
-        
-        msg = f"Your River Runner data is stored in:\n\n"
-        msg += f"Data Folder: {app_dir}\n"
-        msg += f"Database: {db_path}\n"
-        msg += f"Attachments: {os.path.join(app_dir, 'attachments')}\n\n"
-        msg += "You can backup this entire folder to preserve all your river data and attachments."
         
-        # Create message box with option to open folder
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Data Location")
-        msg_box.setText(msg)
-        msg_box.setIcon(QMessageBox.Icon.Information)
-        
-        # Add custom button to open folder
-        open_folder_button = msg_box.addButton("Open Folder", QMessageBox.ButtonRole.ActionRole)
-        ok_button = msg_box.addButton(QMessageBox.StandardButton.Ok)
-        msg_box.setDefaultButton(ok_button)
+        # The locations never change, so the message box is built once and reused
+        if self.data_location_box is None:
+            db_path = self.db_manager.db_path
+            
+            msg = f"Your River Runner data is stored in:\n\n"
+            msg += f"Data Folder: {app_dir}\n"
+            msg += f"Database: {db_path}\n"
+            msg += f"Attachments: {os.path.join(app_dir, 'attachments')}\n\n"
+            msg += "You can backup this entire folder to preserve all your river data and attachments."
+            
+            # Create message box with option to open folder
+            self.data_location_box = QMessageBox(self)
+            self.data_location_box.setWindowTitle("Data Location")
+            self.data_location_box.setText(msg)
+            self.data_location_box.setIcon(QMessageBox.Icon.Information)
+            
+            # Add custom button to open folder
+            self.open_folder_button = self.data_location_box.addButton("Open Folder", QMessageBox.ButtonRole.ActionRole)
+            ok_button = self.data_location_box.addButton(QMessageBox.StandardButton.Ok)
+            self.data_location_box.setDefaultButton(ok_button)
         
-        result = msg_box.exec()
+        self.data_location_box.exec()
         
         # If user clicked "Open Folder", open the data directory
-        if msg_box.clickedButton() == open_folder_button:
+        if self.data_location_box.clickedButton() == self.open_folder_button:
             try:
-                if platform.system() == "Windows":
-                    os.startfile(app_dir)
-                elif platform.system() == "Darwin":  # macOS
-                    os.system(f'open "{app_dir}"')
-                else:  # Linux
-                    os.system(f'xdg-open "{app_dir}"')
+                _open_native(app_dir)
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not open folder: {str(e)}")
     
     def open_documentation(self):
         """Open documentation in default browser"""
         try:
+            import webbrowser
             webbrowser.open("https://github.com/jackworthen/river-run")
             self.status_bar.showMessage("Documentation opened in browser")
         except Exception as e:
@@ -2718,14 +3066,17 @@ def main():
     app.setOrganizationName("River Runner")
     
     # Set application icon early for taskbar display
-    icon_path = get_icon_path()
-    if icon_path and os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    icon = get_app_icon()
+    if icon:
+        app.setWindowIcon(icon)
     
     # Create and show main window
     window = MainWindow()
     window.show()
     
+    # Finish background database work and release the connections on shutdown
+    app.aboutToQuit.connect(window.shutdown)
+    
     # Start the application
     sys.exit(app.exec())
 